@@ -14,10 +14,17 @@ from dotenv import load_dotenv
 
 import config
 from database import Database
-from helpers import log_to_modlog_channel, make_embed
+from helpers import has_any_role, log_to_modlog_channel, make_embed
 
 logger = logging.getLogger(__name__)
 
+# Fake moderation replies for AI-targeted users; %s is the author mention
+_FAKE_ACTIONS = (
+    "🤖 *fake warns* %s - your message was a bit sus fr fr",
+    "🤖 *fake mutes* %s - taking a break from being problematic 💀",
+    "🤖 *fake ban* %s - you've been absolutely cooked 🔥",
+)
+
 
 class TimeoutActionView(discord.ui.View):
     """View for timeout alert actions."""
@@ -381,7 +388,7 @@ async def main() -> None:
                     if isinstance(member, discord.Member):
                         staff_role_ids = set(guild_settings.staff_role_ids + guild_settings.head_mod_role_ids + 
                                           guild_settings.senior_mod_role_ids + guild_settings.moderator_role_ids + guild_settings.admin_role_ids)
-                        is_staff = any(role.id in staff_role_ids for role in member.roles)
+                        is_staff = has_any_role(member, staff_role_ids)
                     
                     if not is_staff:
                         # Take timeout action
@@ -451,18 +458,13 @@ async def main() -> None:
             try:
                 from helpers import get_ai_response
                 
-                # Generate roasting response
-                roast_prompt = f"Roast this user in a funny, lighthearted way: {message.content}"
-                roast_response = await get_ai_response(roast_prompt, "funny")
-                
-                # Sometimes do fake moderation actions
+                # Sometimes do fake moderation actions; decided first so the Gemini call is skipped
                 if random.random() < 0.1:  # 10% chance for fake actions
-                    fake_actions = [
-                        f"🤖 *fake warns* {message.author.mention} - your message was a bit sus fr fr",
-                        f"🤖 *fake mutes* {message.author.mention} - taking a break from being problematic 💀",
-                        f"🤖 *fake ban* {message.author.mention} - you've been absolutely cooked 🔥"
-                    ]
-                    roast_response = random.choice(fake_actions)
+                    roast_response = _FAKE_ACTIONS[random.randrange(len(_FAKE_ACTIONS))] % message.author.mention
+                else:
+                    # Generate roasting response
+                    roast_prompt = f"Roast this user in a funny, lighthearted way: {message.content}"
+                    roast_response = await get_ai_response(roast_prompt, "funny")
                 
                 embed = make_embed(
                     action="ai",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -26,6 +27,12 @@ from helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent channel permission edits in lockchannels/unlockchannels
+_CHANNEL_EDIT_CONCURRENCY = 10
+
+# stafflist strike badge, indexed by min(strike_count, 5)
+_FLAG_EMOJIS = ("", "✅", "✅", "⚠️", "🟠", "🔴")
+
 
 class AdminCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
@@ -67,18 +74,19 @@ class AdminCog(commands.Cog):
             embed.add_field(name="⚠️ Warning", value="Auto-termination triggered!", inline=False)
         message = await ctx.send(embed=embed)
 
-        await self.db.add_modlog(
-            guild_id=ctx.guild.id,  # type: ignore[union-attr]
-            action_type="flag",
-            user_id=member.id,
-            moderator_id=ctx.author.id,
-            reason=reason,
-            message_id=message.id,
+        # The modlog row and the modlog channel post are independent; overlap them
+        await asyncio.gather(
+            self.db.add_modlog(
+                guild_id=ctx.guild.id,  # type: ignore[union-attr]
+                action_type="flag",
+                user_id=member.id,
+                moderator_id=ctx.author.id,
+                reason=reason,
+                message_id=message.id,
+            ),
+            log_to_modlog_channel(self.bot, guild=ctx.guild, settings=settings, embed=embed, file=None),
         )
 
-        # Log to modlog channel
-        await log_to_modlog_channel(self.bot, guild=ctx.guild, settings=settings, embed=embed, file=None)
-
         if strike >= config.MAX_STAFF_FLAGS:
             await self._terminate(ctx, member, reason=f"Auto-terminate: {config.MAX_STAFF_FLAGS} flags - {reason}")
             await safe_dm(ctx.author, embed=make_embed(action="terminate", title="Auto Terminate", description=f"{member} reached {config.MAX_STAFF_FLAGS} strikes and was terminated."))
@@ -102,18 +110,18 @@ class AdminCog(commands.Cog):
         )
         message = await ctx.send(embed=embed)
 
-        await self.db.add_modlog(
-            guild_id=ctx.guild.id,  # type: ignore[union-attr]
-            action_type="unflag",
-            user_id=member.id,
-            moderator_id=ctx.author.id,
-            reason=f"Removed flag {strike_id}",
-            message_id=message.id,
-        )
-
-        # Log to modlog channel
         settings = await self._settings(ctx.guild)
-        await log_to_modlog_channel(self.bot, guild=ctx.guild, settings=settings, embed=embed, file=None)
+        await asyncio.gather(
+            self.db.add_modlog(
+                guild_id=ctx.guild.id,  # type: ignore[union-attr]
+                action_type="unflag",
+                user_id=member.id,
+                moderator_id=ctx.author.id,
+                reason=f"Removed flag {strike_id}",
+                message_id=message.id,
+            ),
+            log_to_modlog_channel(self.bot, guild=ctx.guild, settings=settings, embed=embed, file=None),
+        )
 
         await safe_delete(ctx.message)
 
@@ -125,34 +133,53 @@ class AdminCog(commands.Cog):
             + settings.senior_mod_role_ids
             + settings.moderator_role_ids
         )
-        remove_roles = [r for r in member.roles if r.id in staff_ids]
-        try:
-            if remove_roles:
-                await member.remove_roles(*remove_roles, reason=reason)
-        except discord.Forbidden:
-            pass
-
-        try:
-            await member.timeout(discord.utils.utcnow() + timedelta(days=7), reason=reason)
-        except discord.Forbidden:
-            pass
-
-        await safe_dm(member, embed=make_embed(action="terminate", title=f"You were terminated in {ctx.guild.name}", description=reason))
-
-        await self.db.add_modlog(
-            guild_id=ctx.guild.id,  # type: ignore[union-attr]
-            action_type="terminate",
-            user_id=member.id,
-            moderator_id=ctx.author.id,
-            reason=reason,
-        )
+        until = discord.utils.utcnow() + timedelta(days=7)
+        # The kept roles are passed by ID, so no Role objects need resolving
+        keep_roles = [discord.Object(id=role_id) for role_id in member._roles if role_id not in staff_ids]
+        strip_roles = len(keep_roles) < len(member._roles)
+        timed_out = False
+        # Drop the staff roles and apply the timeout in one member PATCH. Discord
+        # refuses to time out administrators and then rejects the whole PATCH, so
+        # they only get the role edit below
+        if strip_roles and not member.guild_permissions.administrator:
+            try:
+                await member.edit(roles=keep_roles, timed_out_until=until, reason=reason)
+                strip_roles = False
+                timed_out = True
+            except discord.Forbidden:
+                pass
+
+        # The combined edit was skipped or refused: the role strip must not depend
+        # on the timeout going through
+        if strip_roles:
+            try:
+                await member.edit(roles=keep_roles, reason=reason)
+            except discord.Forbidden:
+                pass
+
+        if not timed_out:
+            try:
+                await member.timeout(until, reason=reason)
+            except discord.Forbidden:
+                pass
 
         owner_embed = make_embed(
             action="terminate",
             title="Staff Action: terminate",
             description=f"Guild: **{ctx.guild.name}** (`{ctx.guild.id}`)\nStaff: {member} (`{member.id}`)\nAdmin: {ctx.author} (`{ctx.author.id}`)\nReason: {reason}",
         )
-        await notify_owner(self.bot, embed=owner_embed)
+        # Member DM, modlog row and owner notice do not depend on each other
+        await asyncio.gather(
+            safe_dm(member, embed=make_embed(action="terminate", title=f"You were terminated in {ctx.guild.name}", description=reason)),
+            self.db.add_modlog(
+                guild_id=ctx.guild.id,  # type: ignore[union-attr]
+                action_type="terminate",
+                user_id=member.id,
+                moderator_id=ctx.author.id,
+                reason=reason,
+            ),
+            notify_owner(self.bot, embed=owner_embed),
+        )
 
     @commands.command(name="terminate")
     @commands.guild_only()
@@ -171,6 +198,50 @@ class AdminCog(commands.Cog):
 
         await safe_delete(ctx.message)
 
+    async def _set_category_send_messages(
+        self,
+        ctx: commands.Context,
+        settings: GuildSettings,
+        member_role: discord.Role,
+        *,
+        send_messages: bool | None,
+        action_type: str,
+        reason: str,
+    ) -> tuple[int, int]:
+        """Set send_messages for member_role on every text channel in the lock categories.
+
+        Permission edits run concurrently (bounded by _CHANNEL_EDIT_CONCURRENCY).
+        Returns (ok, failed).
+        """
+        channels = []
+        for cat_id in settings.lock_categories:
+            category = ctx.guild.get_channel(cat_id)  # type: ignore[union-attr]
+            if isinstance(category, discord.CategoryChannel):
+                channels.extend(category.text_channels)
+
+        sem = asyncio.Semaphore(_CHANNEL_EDIT_CONCURRENCY)
+
+        async def edit(channel: discord.TextChannel) -> None:
+            overwrite = channel.overwrites_for(member_role)
+            overwrite.send_messages = send_messages
+            async with sem:
+                await channel.set_permissions(member_role, overwrite=overwrite, reason=f"{reason} by {ctx.author}")
+
+        results = await asyncio.gather(*(edit(c) for c in channels), return_exceptions=True)
+        edited = [c for c, result in zip(channels, results) if not isinstance(result, BaseException)]
+        await self.db.add_modlog_many(
+            {
+                "guild_id": ctx.guild.id,  # type: ignore[union-attr]
+                "action_type": action_type,
+                "user_id": None,
+                "moderator_id": ctx.author.id,
+                "target_id": channel.id,
+                "reason": reason,
+            }
+            for channel in edited
+        )
+        return len(edited), len(channels) - len(edited)
+
     @commands.command(name="lockchannels")
     @commands.guild_only()
     @commands_channel_check()
@@ -194,23 +265,11 @@ class AdminCog(commands.Cog):
             return
 
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
-        ok = 0
-        failed = 0
-        for cat_id in settings.lock_categories:
-            category = ctx.guild.get_channel(cat_id)  # type: ignore[union-attr]
-            if not isinstance(category, discord.CategoryChannel):
-                continue
-            for channel in category.text_channels:
-                overwrite = channel.overwrites_for(member_role)
-                overwrite.send_messages = False
-                try:
-                    await channel.set_permissions(member_role, overwrite=overwrite, reason=f"lockchannels by {ctx.author}")
-                    ok += 1
-                    await self.db.add_modlog(guild_id=ctx.guild.id, action_type="lock", user_id=None, moderator_id=ctx.author.id, target_id=channel.id, reason="lockchannels")  # type: ignore[union-attr]
-                except Exception:
-                    failed += 1
+        ok, failed = await self._set_category_send_messages(
+            ctx, settings, member_role, send_messages=False, action_type="lock", reason="lockchannels"
+        )
 
         embed = make_embed(action="lockchannels", title="🔒 Categories Locked", description=f"✔️ Locked: **{ok}**\n❌ Failed: **{failed}**")
         await ctx.send(embed=embed)
@@ -238,23 +297,11 @@ class AdminCog(commands.Cog):
             return
 
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
-        ok = 0
-        failed = 0
-        for cat_id in settings.lock_categories:
-            category = ctx.guild.get_channel(cat_id)  # type: ignore[union-attr]
-            if not isinstance(category, discord.CategoryChannel):
-                continue
-            for channel in category.text_channels:
-                overwrite = channel.overwrites_for(member_role)
-                overwrite.send_messages = None
-                try:
-                    await channel.set_permissions(member_role, overwrite=overwrite, reason=f"unlockchannels by {ctx.author}")
-                    ok += 1
-                    await self.db.add_modlog(guild_id=ctx.guild.id, action_type="unlock", user_id=None, moderator_id=ctx.author.id, target_id=channel.id, reason="unlockchannels")  # type: ignore[union-attr]
-                except Exception:
-                    failed += 1
+        ok, failed = await self._set_category_send_messages(
+            ctx, settings, member_role, send_messages=None, action_type="unlock", reason="unlockchannels"
+        )
 
         embed = make_embed(action="unlockchannels", title="🔓 Categories Unlocked", description=f"✔️ Unlocked: **{ok}**\n❌ Failed: **{failed}**")
         await ctx.send(embed=embed)
@@ -271,7 +318,8 @@ class AdminCog(commands.Cog):
         embed.add_field(name="🆕 New Account (< 7d)", value="Yes" if age_days < 7 else "No", inline=True)
 
         # very lightweight alt check: same name prefix
-        similar = [m for m in ctx.guild.members if m.id != member.id and m.name.lower().startswith(member.name.lower()[:4])]  # type: ignore[union-attr]
+        prefix = member.name.lower()[:4]
+        similar = [m for m in ctx.guild.members if m.id != member.id and m.name.lower().startswith(prefix)]  # type: ignore[union-attr]
         embed.add_field(name="👥 Similar Usernames", value=str(len(similar)), inline=True)
         if age_days < 7 or len(similar) >= 3:
             embed.add_field(name="⚠️ Suspicious", value="Yes", inline=False)
@@ -284,24 +332,25 @@ class AdminCog(commands.Cog):
     async def stafflist(self, ctx: commands.Context) -> None:
         settings = await self._settings(ctx.guild)  # type: ignore[arg-type]
 
-        def has(role_ids: list[int], member: discord.Member) -> bool:
-            return any(r.id in set(role_ids) for r in member.roles)
-
-        def get_flag_emoji(strike_count: int) -> str:
-            if strike_count == 0:
-                return ""
-            elif strike_count <= 2:
-                return "✅"
-            elif strike_count == 3:
-                return "⚠️"
-            elif strike_count == 4:
-                return "🟠"
-            else:
-                return "🔴"
-
-        mods = [m for m in ctx.guild.members if has(settings.moderator_role_ids, m)]  # type: ignore[union-attr]
-        seniors = [m for m in ctx.guild.members if has(settings.senior_mod_role_ids, m)]  # type: ignore[union-attr]
-        heads = [m for m in ctx.guild.members if has(settings.head_mod_role_ids, m)]  # type: ignore[union-attr]
+        def has(role_set: frozenset[int], member: discord.Member) -> bool:
+            # member._roles holds plain role IDs; no Role objects are built
+            return not role_set.isdisjoint(member._roles)
+
+        mod_set = frozenset(settings.moderator_role_ids)
+        senior_set = frozenset(settings.senior_mod_role_ids)
+        head_set = frozenset(settings.head_mod_role_ids)
+
+        # One pass over the guild; each member is listed under their highest tier only
+        mods: list[discord.Member] = []
+        seniors: list[discord.Member] = []
+        heads: list[discord.Member] = []
+        for m in ctx.guild.members:  # type: ignore[union-attr]
+            if has(head_set, m):
+                heads.append(m)
+            elif has(senior_set, m):
+                seniors.append(m)
+            elif has(mod_set, m):
+                mods.append(m)
 
         entries: list[tuple[str, list[discord.Member]]] = [
             ("Head Moderators", heads),
@@ -309,15 +358,20 @@ class AdminCog(commands.Cog):
             ("Moderators", mods),
         ]
 
+        # One grouped query for the strike counts of everyone shown
+        flag_counts = await self.db.count_active_staff_flags(
+            guild_id=ctx.guild.id,  # type: ignore[union-attr]
+            staff_user_ids=[m.id for _, members in entries for m in members[:50]],
+        )
+
         pages: list[Page] = []
         for title, members in entries:
             embed = make_embed(action="stafflist", title=f"👮 {title}")
             if members:
                 lines: list[str] = []
                 for m in members[:50]:
-                    flags = await self.db.get_active_staff_flags(guild_id=ctx.guild.id, staff_user_id=m.id)  # type: ignore[union-attr]
-                    strike_count = len(flags)
-                    emoji = get_flag_emoji(strike_count)
+                    strike_count = flag_counts[m.id]
+                    emoji = _FLAG_EMOJIS[min(strike_count, 5)]
                     if strike_count > 0:
                         lines.append(f"👤 {m} (`{m.id}`) - {emoji} 🚩 Flags: **{strike_count}/{config.MAX_STAFF_FLAGS}**")
                     else:
@@ -26,6 +26,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Arguments accepted by !toggle_ai, and the subset that turns AI on
+_AI_TOGGLE_STATES = frozenset({"on", "off", "enable", "disable"})
+_AI_ON_STATES = frozenset({"on", "enable"})
+
 
 class AIButton(discord.ui.Button):
     """Base class for AI settings buttons."""
@@ -158,7 +162,7 @@ class AICog(commands.Cog):
             return
         
         # Add loading reaction
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             # Get AI settings to determine personality
@@ -208,7 +212,7 @@ class AICog(commands.Cog):
     async def toggle_ai_command(self, ctx: commands.Context, state: str) -> None:
         """Toggle AI on/off for the server."""
         state = state.lower()
-        if state not in ["on", "off", "enable", "disable"]:
+        if state not in _AI_TOGGLE_STATES:
             embed = make_embed(
                 action="error",
                 title="Invalid State",
@@ -217,7 +221,7 @@ class AICog(commands.Cog):
             await ctx.send(embed=embed)
             return
         
-        new_state = state in ["on", "enable"]
+        new_state = state in _AI_ON_STATES
         
         try:
             await self.db.update_ai_settings(ctx.guild.id, ai_enabled=new_state)  # type: ignore[arg-type]
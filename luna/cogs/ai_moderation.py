@@ -6,6 +6,7 @@ import logging
 import random
 import re
 from datetime import datetime
+from itertools import islice
 from typing import TYPE_CHECKING
 
 import discord
@@ -49,7 +50,7 @@ class AIModerationCog(commands.Cog):
     @require_owner()
     async def aiwarn(self, ctx: commands.Context, member: discord.Member, *, reason: str) -> None:
         """AI warns a user instead of a moderator."""
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             # Add warning
@@ -97,7 +98,7 @@ class AIModerationCog(commands.Cog):
     @require_owner()
     async def aimute(self, ctx: commands.Context, member: discord.Member, duration: str, *, reason: str) -> None:
         """AI mutes a user instead of a moderator."""
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             from helpers import parse_duration
@@ -148,7 +149,7 @@ class AIModerationCog(commands.Cog):
     @require_owner()
     async def aikick(self, ctx: commands.Context, member: discord.Member, *, reason: str) -> None:
         """AI kicks a user instead of a moderator."""
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             await member.kick(reason=f"AI Kick: {reason}")
@@ -189,7 +190,7 @@ class AIModerationCog(commands.Cog):
     @require_owner()
     async def aiban(self, ctx: commands.Context, member: discord.Member, *, reason: str) -> None:
         """AI bans a user instead of a moderator."""
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             await member.ban(reason=f"AI Ban: {reason}")
@@ -238,7 +239,7 @@ class AIModerationCog(commands.Cog):
     @require_owner()
     async def aiflag(self, ctx: commands.Context, member: discord.Member, *, reason: str) -> None:
         """AI flags a staff member instead of an admin."""
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             # Add staff flag
@@ -891,7 +892,7 @@ class PhrasesView(discord.ui.View):
         """Create the phrases list embed."""
         start_idx = self.current_page * self.phrases_per_page
         end_idx = start_idx + self.phrases_per_page
-        page_phrases = self.phrases[start_idx:end_idx]
+        page_phrases = islice(self.phrases, start_idx, end_idx)
         
         total_pages = (len(self.phrases) + self.phrases_per_page - 1) // self.phrases_per_page
         
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import discord
 from discord.ext import commands, tasks
 
 from database import Database
+from helpers import fire_safe_dm, make_embed
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,9 @@ class BackgroundTasksCog(commands.Cog):
         self.temp_role_expiry_loop.start()
         self.staff_flag_expiry_loop.start()
         self.mute_expiry_loop.start()
+        self.reminder_expiry_loop.start()
+        self.mod_stats_window_loop.start()
+        self.dm_log_prune_loop.start()
         self.ai_rate_limit_cleanup_loop.start()
 
     @property
@@ -61,14 +66,16 @@ class BackgroundTasksCog(commands.Cog):
                 return
             ids = [int(r["id"]) for r in rows]
             await self.db.expire_warning_ids(ids)
-            for r in rows:
-                await self.db.add_modlog(
-                    guild_id=int(r["guild_id"]),
-                    action_type="warn_expired",
-                    user_id=int(r["user_id"]),
-                    moderator_id=None,
-                    reason="Warning expired",
-                )
+            await self.db.add_modlog_many(
+                {
+                    "guild_id": int(r["guild_id"]),
+                    "action_type": "warn_expired",
+                    "user_id": int(r["user_id"]),
+                    "moderator_id": None,
+                    "reason": "Warning expired",
+                }
+                for r in rows
+            )
         except Exception:
             logger.exception("warn_expiry_loop failed")
 
@@ -81,6 +88,7 @@ class BackgroundTasksCog(commands.Cog):
             ids = [int(r["id"]) for r in rows]
             await self.db.expire_temp_role_ids(ids)
 
+            modlog_rows = []
             for r in rows:
                 guild = self.bot.get_guild(int(r["guild_id"]))
                 if guild is None:
@@ -92,14 +100,17 @@ class BackgroundTasksCog(commands.Cog):
                         await member.remove_roles(role, reason="Temp role expired")
                     except discord.Forbidden:
                         pass
-                await self.db.add_modlog(
-                    guild_id=int(r["guild_id"]),
-                    action_type="temp_role_expired",
-                    user_id=int(r["user_id"]),
-                    moderator_id=None,
-                    target_id=int(r["role_id"]),
-                    reason="Temp role expired",
+                modlog_rows.append(
+                    {
+                        "guild_id": int(r["guild_id"]),
+                        "action_type": "temp_role_expired",
+                        "user_id": int(r["user_id"]),
+                        "moderator_id": None,
+                        "target_id": int(r["role_id"]),
+                        "reason": "Temp role expired",
+                    }
                 )
+            await self.db.add_modlog_many(modlog_rows)
         except Exception:
             logger.exception("temp_role_expiry_loop failed")
 
@@ -125,6 +136,54 @@ class BackgroundTasksCog(commands.Cog):
         except Exception:
             logger.exception("mute_expiry_loop failed")
 
+    @tasks.loop(seconds=30)
+    async def reminder_expiry_loop(self) -> None:
+        try:
+            rows = await self.db.get_expired_reminders(limit=200)
+            if not rows:
+                return
+            # Only reminders that were dispatched (or whose user no longer exists)
+            # are expired; transient fetch failures are retried on the next run
+            done: list[int] = []
+            for r in rows:
+                user_id = int(r["user_id"])
+                try:
+                    user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                except discord.NotFound:
+                    done.append(int(r["id"]))
+                    continue
+                except discord.HTTPException:
+                    logger.warning("Failed to fetch user %s for reminder %s; will retry", user_id, r["id"])
+                    continue
+                embed = make_embed(
+                    action="reminder",
+                    title="⏰ Reminder",
+                    description=r["text"],
+                )
+                fire_safe_dm(user, embed=embed)
+                done.append(int(r["id"]))
+
+            if done:
+                await self.db.expire_reminder_ids(done)
+        except Exception:
+            logger.exception("reminder_expiry_loop failed")
+
+    @tasks.loop(hours=1)
+    async def mod_stats_window_loop(self) -> None:
+        try:
+            await self.db.refresh_mod_stat_counts()
+        except Exception:
+            logger.exception("mod_stats_window_loop failed")
+
+    @tasks.loop(hours=24)
+    async def dm_log_prune_loop(self) -> None:
+        try:
+            # Work in bounded batches so one run never holds the writer for long
+            while await self.db.prune_dm_notification_log() > 0:
+                await asyncio.sleep(0)
+        except Exception:
+            logger.exception("dm_log_prune_loop failed")
+
     @tasks.loop(minutes=5)
     async def ai_rate_limit_cleanup_loop(self) -> None:
         """Clean up expired rate limit entries."""
@@ -138,6 +197,9 @@ class BackgroundTasksCog(commands.Cog):
     @temp_role_expiry_loop.before_loop
     @staff_flag_expiry_loop.before_loop
     @mute_expiry_loop.before_loop
+    @reminder_expiry_loop.before_loop
+    @mod_stats_window_loop.before_loop
+    @dm_log_prune_loop.before_loop
     async def _before(self) -> None:
         await self.bot.wait_until_ready()
 
@@ -13,6 +13,31 @@ from helpers import make_embed, require_owner
 
 logger = logging.getLogger(__name__)
 
+# Presence options accepted by !botstatus / !botactivity and restored on startup
+_STATUS_MAP: dict[str, discord.Status] = {
+    "online": discord.Status.online,
+    "idle": discord.Status.idle,
+    "dnd": discord.Status.dnd,
+    "invisible": discord.Status.invisible,
+}
+_ACTIVITY_MAP: dict[str, discord.ActivityType] = {
+    "playing": discord.ActivityType.playing,
+    "watching": discord.ActivityType.watching,
+    "listening": discord.ActivityType.listening,
+}
+# !botinfo display emoji
+_STATUS_EMOJI: dict[str, str] = {
+    "online": "🟢",
+    "idle": "🌙",
+    "dnd": "⛔",
+    "invisible": "⚫",
+}
+_ACTIVITY_EMOJI: dict[str, str] = {
+    "playing": "🎮",
+    "watching": "👀",
+    "listening": "🎧",
+}
+
 
 class BotManagementCog(commands.Cog):
     """Owner-only commands for customizing bot appearance and presence."""
@@ -20,6 +45,18 @@ class BotManagementCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self._startup_done = False
+        self._http: aiohttp.ClientSession | None = None
+
+    async def cog_unload(self) -> None:
+        if self._http:
+            await self._http.close()
+            self._http = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session for image downloads, opened on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300))
+        return self._http
 
     @property
     def db(self) -> Database:
@@ -47,22 +84,10 @@ class BotManagementCog(commands.Cog):
                     logger.error(f"Failed to restore bot name: {e}")
 
             # Restore status and activity
-            status_map = {
-                "online": discord.Status.online,
-                "idle": discord.Status.idle,
-                "dnd": discord.Status.dnd,
-                "invisible": discord.Status.invisible,
-            }
-            activity_map = {
-                "playing": discord.ActivityType.playing,
-                "watching": discord.ActivityType.watching,
-                "listening": discord.ActivityType.listening,
-            }
-
-            status = status_map.get(settings.status_type.lower()) if settings.status_type else None
+            status = _STATUS_MAP.get(settings.status_type.lower()) if settings.status_type else None
             activity = None
             if settings.activity_type and settings.activity_text:
-                act_type = activity_map.get(settings.activity_type.lower())
+                act_type = _ACTIVITY_MAP.get(settings.activity_type.lower())
                 if act_type:
                     activity = discord.Activity(type=act_type, name=settings.activity_text)
 
@@ -84,13 +109,12 @@ class BotManagementCog(commands.Cog):
             avatar_bytes = None
 
             if url:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as resp:
-                        if resp.status != 200:
-                            embed = make_embed(action="error", title="❌ Error", description="Failed to download image from URL.")
-                            await ctx.send(embed=embed)
-                            return
-                        avatar_bytes = await resp.read()
+                async with self._get_session().get(url) as resp:
+                    if resp.status != 200:
+                        embed = make_embed(action="error", title="❌ Error", description="Failed to download image from URL.")
+                        await ctx.send(embed=embed)
+                        return
+                    avatar_bytes = await resp.read()
             elif ctx.message.attachments:
                 avatar_bytes = await ctx.message.attachments[0].read()
             else:
@@ -127,13 +151,12 @@ class BotManagementCog(commands.Cog):
             banner_bytes = None
 
             if url:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as resp:
-                        if resp.status != 200:
-                            embed = make_embed(action="error", title="❌ Error", description="Failed to download image from URL.")
-                            await ctx.send(embed=embed)
-                            return
-                        banner_bytes = await resp.read()
+                async with self._get_session().get(url) as resp:
+                    if resp.status != 200:
+                        embed = make_embed(action="error", title="❌ Error", description="Failed to download image from URL.")
+                        await ctx.send(embed=embed)
+                        return
+                    banner_bytes = await resp.read()
             elif ctx.message.attachments:
                 banner_bytes = await ctx.message.attachments[0].read()
             else:
@@ -194,20 +217,13 @@ class BotManagementCog(commands.Cog):
 
         Usage: !botstatus <online/idle/dnd/invisible>
         """
-        status_map = {
-            "online": discord.Status.online,
-            "idle": discord.Status.idle,
-            "dnd": discord.Status.dnd,
-            "invisible": discord.Status.invisible
-        }
-
-        if status.lower() not in status_map:
+        if status.lower() not in _STATUS_MAP:
             embed = make_embed(action="error", title="❌ Invalid Status", description="Valid options: online, idle, dnd, invisible")
             await ctx.send(embed=embed)
             return
 
         try:
-            await self.bot.change_presence(status=status_map[status.lower()])
+            await self.bot.change_presence(status=_STATUS_MAP[status.lower()])
             await self.db.update_bot_settings(status_type=status.lower())
 
             embed = make_embed(action="botstatus", title="✅ Status Updated", description=f"Status set to **{status}**.")
@@ -225,19 +241,13 @@ class BotManagementCog(commands.Cog):
 
         Usage: !botactivity <playing/watching/listening> <text>
         """
-        activity_map = {
-            "playing": discord.ActivityType.playing,
-            "watching": discord.ActivityType.watching,
-            "listening": discord.ActivityType.listening
-        }
-
-        if activity_type.lower() not in activity_map:
+        if activity_type.lower() not in _ACTIVITY_MAP:
             embed = make_embed(action="error", title="❌ Invalid Activity", description="Valid options: playing, watching, listening")
             await ctx.send(embed=embed)
             return
 
         try:
-            activity = discord.Activity(type=activity_map[activity_type.lower()], name=text)
+            activity = discord.Activity(type=_ACTIVITY_MAP[activity_type.lower()], name=text)
             await self.bot.change_presence(activity=activity)
             await self.db.update_bot_settings(activity_type=activity_type.lower(), activity_text=text)
 
@@ -269,23 +279,12 @@ class BotManagementCog(commands.Cog):
             embed.add_field(name="📝 Custom Name", value=f"**{settings.custom_name}**" if settings.custom_name else "❌ Default", inline=False)
 
             # Status
-            status_emoji = {
-                "online": "🟢",
-                "idle": "🌙",
-                "dnd": "⛔",
-                "invisible": "⚫",
-            }
-            status_display = f"{status_emoji.get(settings.status_type, '❓')} {settings.status_type.title()}" if settings.status_type else "❌ Default"
+            status_display = f"{_STATUS_EMOJI.get(settings.status_type, '❓')} {settings.status_type.title()}" if settings.status_type else "❌ Default"
             embed.add_field(name="📊 Status", value=status_display, inline=True)
 
             # Activity
             if settings.activity_type and settings.activity_text:
-                activity_emoji = {
-                    "playing": "🎮",
-                    "watching": "👀",
-                    "listening": "🎧",
-                }
-                activity_display = f"{activity_emoji.get(settings.activity_type, '📺')} **{settings.activity_type.title()}** {settings.activity_text}"
+                activity_display = f"{_ACTIVITY_EMOJI.get(settings.activity_type, '📺')} **{settings.activity_type.title()}** {settings.activity_text}"
                 embed.add_field(name="🎯 Activity", value=activity_display, inline=True)
             else:
                 embed.add_field(name="🎯 Activity", value="❌ Default", inline=True)
@@ -94,7 +94,7 @@ class ChannelsCog(commands.Cog):
             return
 
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
         ok = 0
         failed = 0
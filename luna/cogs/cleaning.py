@@ -26,8 +26,9 @@ class CleaningCog(commands.Cog):
         if amount <= 0:
             amount = 1
         deleted = 0
+        bot_id = self.bot.user.id  # type: ignore[union-attr]
         async for msg in ctx.channel.history(limit=amount):  # type: ignore[union-attr]
-            if msg.author.id == self.bot.user.id:  # type: ignore[union-attr]
+            if msg.author.id == bot_id:
                 try:
                     await msg.delete()
                     deleted += 1
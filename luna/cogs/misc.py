@@ -370,7 +370,7 @@ class MiscCog(commands.Cog):
             await ctx.send(embed=embed)
             return
         
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             # Get the referenced message
@@ -20,6 +20,7 @@ from helpers import (
     commands_channel_check,
     discord_timestamp,
     extract_id,
+    fire_safe_dm,
     humanize_seconds,
     log_owner_override,
     log_to_modlog_channel,
@@ -1123,7 +1124,7 @@ class ModerationCog(commands.Cog):
 
         # Add loading reaction for long-running operation
         from helpers import add_loading_reaction
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
         ok = 0
         failed = 0
@@ -1181,7 +1182,7 @@ class ModerationCog(commands.Cog):
 
         # Add loading reaction for long-running operation
         from helpers import add_loading_reaction
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
         ok = 0
         failed = 0
@@ -1238,7 +1239,7 @@ class ModerationCog(commands.Cog):
 
         # Add loading reaction for long-running operation
         from helpers import add_loading_reaction
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
 
         ok = 0
         failed = 0
@@ -1260,7 +1261,8 @@ class ModerationCog(commands.Cog):
                     executor_id=ctx.author.id,
                     reason=reason,
                 )
-            await safe_dm(m, embed=make_embed(action="massmute", title=f"🔇 You were muted in {ctx.guild.name}", description=f"⏱️ Duration: {humanize_seconds(seconds)}\n📝 Reason: {reason}"))
+            # Muted members stay in the guild, so the DM need not land before the timeout
+            fire_safe_dm(m, embed=make_embed(action="massmute", title=f"🔇 You were muted in {ctx.guild.name}", description=f"⏱️ Duration: {humanize_seconds(seconds)}\n📝 Reason: {reason}"))
             try:
                 await m.timeout(until, reason=reason)
                 await self.db.add_mute(guild_id=ctx.guild.id, user_id=m.id, moderator_id=ctx.author.id, reason=reason, duration_seconds=seconds)  # type: ignore[union-attr]
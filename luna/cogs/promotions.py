@@ -288,7 +288,7 @@ class PromotionsCog(commands.Cog):
         # Check promotion eligibility
         current_level = metrics["current_level"]
         if current_level == "moderator":
-            eligible, confidence, reason = await engine.check_promotion_eligibility(metrics, "moderator_to_senior")
+            eligible, confidence, reason = engine.check_promotion_eligibility(metrics, "moderator_to_senior")
             if eligible:
                 embed.add_field(
                     name="✅ Promotion Eligible",
@@ -296,7 +296,7 @@ class PromotionsCog(commands.Cog):
                     inline=False
                 )
         elif current_level == "senior_mod":
-            eligible, confidence, reason = await engine.check_promotion_eligibility(metrics, "senior_to_head")
+            eligible, confidence, reason = engine.check_promotion_eligibility(metrics, "senior_to_head")
             if eligible:
                 embed.add_field(
                     name="✅ Promotion Eligible",
@@ -305,7 +305,7 @@ class PromotionsCog(commands.Cog):
                 )
 
         # Check demotion warning
-        should_warn, warn_confidence, warn_reason = await engine.check_demotion_warning(metrics)
+        should_warn, warn_confidence, warn_reason = engine.check_demotion_warning(metrics)
         if should_warn:
             embed.add_field(
                 name="⚠️ Performance Warning",
@@ -312,7 +312,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok, failed = await self._mass_role_op(ctx, members=members, role=role, add=True)
         embed = make_embed(action="massrole", title="📌 Mass Role Assignment Results", description=f"Assigned {role.mention}.\n✔️ Succeeded: **{ok}**\n❌ Failed: **{failed}**")
@@ -332,7 +332,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok, failed = await self._mass_role_op(ctx, members=members, role=role, add=False)
         embed = make_embed(action="massremoverole", title="📌 Mass Role Removal Results", description=f"Removed {role.mention}.\n✔️ Succeeded: **{ok}**\n❌ Failed: **{failed}**")
@@ -353,7 +353,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok = 0
         failed = 0
@@ -381,7 +381,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok = 0
         failed = 0
@@ -410,7 +410,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok = 0
         failed = 0
@@ -438,7 +438,7 @@ class RolesCog(commands.Cog):
         members = self._parse_members(ctx, users)
         
         # Add loading reaction for long-running operation
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         ok = 0
         failed = 0
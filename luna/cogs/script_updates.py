@@ -14,6 +14,16 @@ from helpers import is_admin_member, make_embed, parse_id_list, require_admin
 
 logger = logging.getLogger(__name__)
 
+# Parsed webhooks keyed by URL, bound to the bot's HTTP session
+_webhooks: dict[str, discord.Webhook] = {}
+
+
+def _get_webhook(url: str, client: discord.Client) -> discord.Webhook:
+    webhook = _webhooks.get(url)
+    if webhook is None:
+        webhook = _webhooks[url] = discord.Webhook.from_url(url, client=client)
+    return webhook
+
 
 class ScriptUpdatePanelView(discord.ui.View):
     """Panel view for script update settings."""
@@ -283,16 +293,15 @@ class ScriptUpdateModal(discord.ui.Modal):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                webhook = discord.Webhook.from_url(settings.webhook_url, session=session)
-                message = await webhook.send(
-                    content=content,
-                    embed=embed,
-                    username=settings.webhook_name or config.BOT_NAME,
-                    wait=True,
-                )
-                if isinstance(message, discord.Message):
-                    await self.panel.add_fire_reaction(message, guild=guild)
+            webhook = _get_webhook(settings.webhook_url, self.panel.bot)
+            message = await webhook.send(
+                content=content,
+                embed=embed,
+                username=settings.webhook_name or config.BOT_NAME,
+                wait=True,
+            )
+            if isinstance(message, discord.Message):
+                await self.panel.add_fire_reaction(message, guild=guild)
         except Exception as exc:
             logger.error("Failed to send script update: %s", exc)
             embed = make_embed(action="error", title="❌ Update Failed", description="Unable to send the script update.")
@@ -224,7 +224,7 @@ class StatsCog(commands.Cog):
         
         # Calculate ranking
         all_staff_stats = await self.db.get_all_staff_rankings(ctx.guild.id)
-        rank = next((i + 1 for i, s in enumerate(all_staff_stats) if s['user_id'] == user.id), None)
+        rank = next((i + 1 for i, (user_id, _) in enumerate(all_staff_stats) if user_id == user.id), None)
         
         # Build embed
         embed = make_embed(
@@ -294,13 +294,13 @@ class StatsCog(commands.Cog):
         
         # Enrich with role level information
         enriched_staff = []
-        for stat in all_staff_stats:
-            member = ctx.guild.get_member(stat['user_id'])
+        for user_id, total in all_staff_stats:
+            member = ctx.guild.get_member(user_id)
             if member:
                 level = role_level_for_member(member, settings, trial_mod_role_ids=trial_mod_roles)
                 enriched_staff.append({
                     'member': member,
-                    'total': stat['total'],
+                    'total': total,
                     'level': level
                 })
         
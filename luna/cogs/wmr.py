@@ -56,7 +56,7 @@ class WMR(commands.Cog):
             await ctx.send(embed=embed)
             return
         
-        await add_loading_reaction(ctx.message)
+        add_loading_reaction(ctx.message)
         
         try:
             # Get the referenced message
@@ -214,9 +214,16 @@ EMBED_COLORS: dict[str, int] = {
 }
 
 
+_embed_colors_get = EMBED_COLORS.get
+
+
 def get_embed_color(action_type: str) -> int:
     """Return an embed color for a given action type."""
-    return EMBED_COLORS.get(str(action_type).lower(), EMBED_COLOR_STARLIGHT_BLUE)
+    # Call sites pass lowercase literals, so try the key as-is before normalizing
+    color = _embed_colors_get(action_type) if type(action_type) is str else None
+    if color is None:
+        color = _embed_colors_get(str(action_type).lower(), EMBED_COLOR_STARLIGHT_BLUE)
+    return color
 
 
 # ---------------------------------------------------------------------------
@@ -6,13 +6,19 @@ settings. All methods are designed to be safe to call concurrently from cogs.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import itertools
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiosqlite
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,22 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# (epoch seconds, formatted) of the last _iso_now() call
+_ts_cache: tuple[float, str] = (0.0, "")
+
+
+def _iso_now() -> str:
+    """UTC ISO timestamp, reused for calls within the same millisecond.
+
+    Only for log-style rows; never for columns that take part in a UNIQUE key.
+    """
+    global _ts_cache
+    t = time.time()
+    if t - _ts_cache[0] >= 0.001:
+        _ts_cache = (t, datetime.fromtimestamp(t, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
 @dataclass(slots=True)
 class GuildSettings:
     guild_id: int
@@ -78,6 +100,17 @@ class TimeoutSettings:
     enabled: bool
 
 
+@dataclass(slots=True)
+class DMNotificationSettings:
+    guild_id: int
+    enabled: bool
+    notify_warns: bool
+    notify_mutes: bool
+    notify_kicks: bool
+    notify_bans: bool
+    notify_flags: bool
+
+
 @dataclass(slots=True)
 class BotSettings:
     avatar_url: str | None
@@ -130,28 +163,232 @@ def _int_list_to_csv(value: list[int] | None) -> str:
     return ",".join(str(v) for v in value)
 
 
+# Buffered writes (mod stats, DM log) are flushed by a writer task on this cadence.
+_WRITE_FLUSH_INTERVAL = 0.1
+_WRITE_FLUSH_BATCH = 500
+
+# Key pairs bound per coalesced lookup, well under SQLite's host-parameter limit.
+_IN_CHUNK = 400
+
+# sqlite3 keeps this many prepared statements per connection, keyed by SQL text.
+# The default of 128 is below the number of distinct statements this module issues.
+_STATEMENT_CACHE_SIZE = 512
+
+# Low-volume admin writes wait this long so writes landing together share one commit.
+_GROUP_COMMIT_DELAY = 0.005
+
+# Read-only connections opened next to the writer so SELECTs can run in parallel.
+_READER_COUNT = 2
+
+# Every non-empty subset of the DM toggles maps to one UPDATE, listed in canonical
+# column order so the same fields always produce the same statement text.
+_DM_SETTING_FIELDS = ("enabled", "notify_warns", "notify_mutes", "notify_kicks", "notify_bans", "notify_flags")
+_DM_FIELDS = frozenset(_DM_SETTING_FIELDS)
+_DM_UPDATE_SQL: dict[frozenset[str], tuple[tuple[str, ...], str]] = {
+    frozenset(fields): (
+        fields,
+        f"UPDATE dm_notification_settings SET {', '.join(f'{f} = ?' for f in fields)} WHERE guild_id = ?",
+    )
+    for n in range(1, len(_DM_SETTING_FIELDS) + 1)
+    for fields in itertools.combinations(_DM_SETTING_FIELDS, n)
+}
+
+# Upper bound on cached (user_id, guild_id) DM preferences before the oldest are dropped.
+_DM_PREF_CACHE_SIZE = 4096
+# Seconds a cached DM preference is trusted before it is re-read.
+_DM_PREF_TTL = 300.0
+
+# Rolling windows (in days) kept in mod_stats_counts next to the all-time "total".
+_MOD_STAT_WINDOWS: dict[str, int] = {"30d": 30, "14d": 14, "7d": 7}
+_MOD_STAT_PERIODS: tuple[str, ...] = ("total", *_MOD_STAT_WINDOWS)
+# get_mod_stats result keys, in the order callers have always seen them
+_MOD_STAT_KEYS: tuple[str, ...] = tuple(
+    f"{action}_{period}" for action in ("warns", "mutes", "kicks", "bans") for period in ("7d", "14d", "30d", "total")
+)
+# get_staff_perf_bulk: one pivoted row per user, window totals summed by SQLite.
+_STAFF_PERF_KEYS: tuple[str, ...] = (
+    "warns_7d", "mutes_7d", "kicks_7d", "bans_7d",
+    "warns_30d", "mutes_30d", "kicks_30d", "bans_30d",
+    "total_7d", "total_30d",
+)
+_STAFF_PERF_SELECT = """
+    SELECT user_id,
+        SUM(count) FILTER (WHERE action_type = 'warns' AND period = '7d'),
+        SUM(count) FILTER (WHERE action_type = 'mutes' AND period = '7d'),
+        SUM(count) FILTER (WHERE action_type = 'kicks' AND period = '7d'),
+        SUM(count) FILTER (WHERE action_type = 'bans' AND period = '7d'),
+        SUM(count) FILTER (WHERE action_type = 'warns' AND period = '30d'),
+        SUM(count) FILTER (WHERE action_type = 'mutes' AND period = '30d'),
+        SUM(count) FILTER (WHERE action_type = 'kicks' AND period = '30d'),
+        SUM(count) FILTER (WHERE action_type = 'bans' AND period = '30d'),
+        SUM(count) FILTER (WHERE action_type IN ('warns', 'mutes', 'kicks', 'bans') AND period = '7d'),
+        SUM(count) FILTER (WHERE action_type IN ('warns', 'mutes', 'kicks', 'bans') AND period = '30d')
+    FROM mod_stats_counts
+"""
+
+
+_UPDATE_SQL_CACHE: dict[tuple[str, tuple[str, ...]], str] = {}
+
+
+def _update_sql(table: str, fields: tuple[str, ...]) -> str:
+    """Return the ``UPDATE table SET ... WHERE guild_id = ?`` text for a field set.
+
+    Each distinct field combination is formatted once and reused afterwards.
+    """
+    key = (table, fields)
+    sql = _UPDATE_SQL_CACHE.get(key)
+    if sql is None:
+        assignments = ", ".join(f"{f} = ?" for f in fields)
+        sql = _UPDATE_SQL_CACHE[key] = f"UPDATE {table} SET {assignments} WHERE guild_id = ?"
+    return sql
+
+
 class Database:
     """Async SQLite database wrapper."""
 
     def __init__(self, path: str) -> None:
         self.path = path
         self._conn: aiosqlite.Connection | None = None
+        # Idle read-only connections; LIFO so the warmest page cache is reused first
+        self._readers: asyncio.LifoQueue[aiosqlite.Connection] | None = None
+        self._reader_conns: list[aiosqlite.Connection] = []
+        # Parsed guild settings, consulted by every permission check; cleared on update
+        self._guild_settings_cache: dict[int, GuildSettings] = {}
+        # AI settings read on every !ai command and AI-eligible message; cleared on update
+        self._ai_settings_cache: dict[int, AISettings] = {}
+        # Parsed role ID lists per guild; rewritten by the matching setters
+        self._trial_mod_cache: dict[int, list[int]] = {}
+        self._hierarchy_cache: dict[int, list[int]] = {}
+        # DM notification config read on every moderation action; cleared by the setters
+        self._dm_settings_cache: dict[int, DMNotificationSettings] = {}
+        # (user_id, guild_id) -> (receive_dms, expires_at monotonic)
+        self._dm_pref_cache: dict[tuple[int, int], tuple[bool, float]] = {}
+        # Bumped by set_dm_preference so reads that raced a write do not cache stale values
+        self._dm_pref_gen = 0
+        # Blacklisted guild/user IDs, loaded on connect and kept in sync by the setters
+        self._blacklisted_guilds: set[int] = set()
+        self._blacklisted_users: set[int] = set()
+        # get_ai_target lookups issued in the same event-loop tick, answered by one query
+        self._pending_ai_targets: dict[tuple[int, int], asyncio.Future[AITarget | None]] = {}
+        self._ai_target_flush: asyncio.Task[None] | None = None
+        # Writers waiting on the next group commit
+        self._commit_waiters: list[asyncio.Future[None]] = []
+        self._commit_task: asyncio.Task[None] | None = None
+        # Pending (guild_id, user_id, action_type, timestamp) rows for mod_stats
+        self._mod_buf: deque[tuple[int, int, str, str]] = deque()
+        # Pending (guild_id, user_id, action_type, timestamp, success, reason) DM log rows
+        self._dm_log_buf: deque[tuple[int, int, str, str, int, str | None]] = deque()
+        self._writer: asyncio.Task[None] | None = None
+        # Strong refs to fire-and-forget tasks so they are not garbage-collected mid-flight
+        self._tasks: set[asyncio.Task[None]] = set()
 
     async def connect(self) -> None:
         """Open the SQLite connection and create schema."""
 
-        self._conn = await aiosqlite.connect(self.path)
+        self._conn = await aiosqlite.connect(self.path, cached_statements=_STATEMENT_CACHE_SIZE)
         self._conn.row_factory = aiosqlite.Row
         await self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL only needs to sync at checkpoints, so NORMAL is still crash-safe
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute("PRAGMA temp_store=MEMORY")
+        await self._conn.execute("PRAGMA mmap_size=268435456")
+        await self._conn.execute("PRAGMA cache_size=-65536")
+        await self._conn.execute("PRAGMA busy_timeout=5000")
         await self._conn.execute("PRAGMA foreign_keys=ON")
         await self._init_schema()
+        await self._load_blacklists()
+        await self._open_readers()
+        self._writer = asyncio.create_task(self._buffered_writer())
+
+    async def _open_readers(self) -> None:
+        # A private in-memory database cannot be shared with other connections
+        if self.path == ":memory:":
+            return
+        self._readers = asyncio.LifoQueue()
+        for _ in range(_READER_COUNT):
+            reader = await aiosqlite.connect(self.path, cached_statements=_STATEMENT_CACHE_SIZE)
+            reader.row_factory = aiosqlite.Row
+            await reader.execute("PRAGMA query_only=1")
+            await reader.execute("PRAGMA busy_timeout=5000")
+            self._reader_conns.append(reader)
+            self._readers.put_nowait(reader)
+
+    @contextlib.asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection, falling back to the writer when none are open."""
+        if self._readers is None:
+            yield self.conn
+            return
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
 
     async def close(self) -> None:
         if self._conn is None:
             return
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._flush_buffers()
+        for reader in self._reader_conns:
+            await reader.close()
+        self._reader_conns = []
+        self._readers = None
         await self._conn.close()
         self._conn = None
 
+    def _spawn(self, coro: Any) -> asyncio.Task[None]:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _group_commit(self) -> None:
+        """Commit pending writes together with any others issued in the next few ms."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[None] = loop.create_future()
+        self._commit_waiters.append(fut)
+        if self._commit_task is None:
+            self._commit_task = self._spawn(self._run_group_commit())
+        await asyncio.shield(fut)
+
+    async def _run_group_commit(self) -> None:
+        await asyncio.sleep(_GROUP_COMMIT_DELAY)
+        waiters, self._commit_waiters = self._commit_waiters, []
+        self._commit_task = None
+        try:
+            await self.conn.commit()
+        except Exception as exc:
+            logger.exception("Group commit failed")
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+    async def _buffered_writer(self) -> None:
+        while True:
+            await asyncio.sleep(_WRITE_FLUSH_INTERVAL)
+            await self._flush_buffers()
+
+    async def _flush_buffers(self) -> None:
+        try:
+            await self._flush_mod_actions()
+        except Exception:
+            logger.exception("Failed to track mod actions")
+        try:
+            await self._flush_dm_log()
+        except Exception:
+            logger.exception("Failed to log DM notifications")
+
     @property
     def conn(self) -> aiosqlite.Connection:
         if self._conn is None:
@@ -318,22 +555,128 @@ class Database:
                 UNIQUE(guild_id, user_id, action_type, timestamp)
             );
 
+            CREATE INDEX IF NOT EXISTS idx_mod_stats_timestamp
+                ON mod_stats (timestamp);
+
+            CREATE TABLE IF NOT EXISTS mod_stats_counts (
+                guild_id        INTEGER NOT NULL,
+                user_id         INTEGER NOT NULL,
+                action_type     TEXT NOT NULL,
+                period          TEXT NOT NULL,
+                count           INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id, action_type, period)
+            );
+
             CREATE TABLE IF NOT EXISTS afk (
                 user_id         INTEGER NOT NULL,
                 guild_id        INTEGER NOT NULL,
                 reason          TEXT,
                 timestamp       TEXT NOT NULL,
+                -- Legacy '|||'-joined pings; migrated into afk_pings on startup, no longer written
                 pings           TEXT DEFAULT '',
                 PRIMARY KEY (user_id, guild_id)
             );
 
+            CREATE TABLE IF NOT EXISTS afk_pings (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id         INTEGER NOT NULL,
+                guild_id        INTEGER NOT NULL,
+                info            TEXT NOT NULL,
+                timestamp       TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_afk_pings_user
+                ON afk_pings (user_id, guild_id);
+
+            CREATE TABLE IF NOT EXISTS reminders (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id         INTEGER NOT NULL,
+                guild_id        INTEGER NOT NULL,
+                text            TEXT NOT NULL,
+                expiration_ts   TEXT NOT NULL,
+                is_active       INTEGER NOT NULL DEFAULT 1
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_reminders_active_exp
+                ON reminders (expiration_ts) WHERE is_active = 1;
+
+            CREATE TABLE IF NOT EXISTS dm_notification_settings (
+                guild_id        INTEGER PRIMARY KEY,
+                enabled         BOOLEAN DEFAULT TRUE,
+                notify_warns    BOOLEAN DEFAULT TRUE,
+                notify_mutes    BOOLEAN DEFAULT TRUE,
+                notify_kicks    BOOLEAN DEFAULT TRUE,
+                notify_bans     BOOLEAN DEFAULT TRUE,
+                notify_flags    BOOLEAN DEFAULT TRUE
+            );
+
+            CREATE TABLE IF NOT EXISTS dm_preferences (
+                user_id         INTEGER NOT NULL,
+                guild_id        INTEGER NOT NULL,
+                receive_dms     BOOLEAN DEFAULT TRUE,
+                PRIMARY KEY (user_id, guild_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS dm_notification_log (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id        INTEGER NOT NULL,
+                user_id         INTEGER NOT NULL,
+                action_type     TEXT NOT NULL,
+                timestamp       TEXT NOT NULL,
+                success         BOOLEAN NOT NULL,
+                reason          TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_dm_log_guild_ts
+                ON dm_notification_log (guild_id, timestamp);
+
+            CREATE TABLE IF NOT EXISTS shift_configs (
+                guild_id        INTEGER NOT NULL,
+                role_id         INTEGER NOT NULL,
+                shift_type      TEXT NOT NULL,
+                afk_timeout     INTEGER NOT NULL,
+                weekly_quota    INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, role_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS quota_tracking (
+                user_id         INTEGER NOT NULL,
+                guild_id        INTEGER NOT NULL,
+                shift_type      TEXT NOT NULL,
+                week_gmt8       TEXT NOT NULL,
+                hours_logged    REAL NOT NULL DEFAULT 0,
+                quota_met       BOOLEAN NOT NULL DEFAULT FALSE,
+                PRIMARY KEY (user_id, guild_id, shift_type, week_gmt8)
+            );
+
+            CREATE TABLE IF NOT EXISTS promotion_suggestions (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id        INTEGER NOT NULL,
+                user_id         INTEGER NOT NULL,
+                suggestion_type TEXT NOT NULL,
+                current_role    TEXT,
+                suggested_role  TEXT,
+                confidence      REAL NOT NULL,
+                reason          TEXT,
+                metrics         TEXT,
+                timestamp       TEXT NOT NULL,
+                status          TEXT NOT NULL DEFAULT 'pending',
+                reviewed_by     INTEGER,
+                reviewed_at     TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_promo_sugg_pending
+                ON promotion_suggestions (guild_id, status, timestamp DESC);
+            CREATE INDEX IF NOT EXISTS idx_promo_sugg_user
+                ON promotion_suggestions (guild_id, user_id, timestamp DESC);
+
             CREATE TABLE IF NOT EXISTS trial_mod_roles (
                 guild_id        INTEGER PRIMARY KEY,
                 role_ids        TEXT DEFAULT ''
             );
 
             CREATE TABLE IF NOT EXISTS bot_settings (
-                id INTEGER PRIMARY CHECK (id = 1),
+                id INTEGER PRIMARY KEY CHECK (id = 1),
                 avatar_url TEXT,
                 banner_url TEXT,
                 custom_name TEXT,
@@ -369,7 +712,56 @@ class Database:
                 ON permission_overrides (timestamp);
             """
         )
+        await self._create_mod_stats_trigger()
+        await self._migrate_afk_pings()
         await self.conn.commit()
+        await self.refresh_mod_stat_counts(include_total=True)
+
+    async def _create_mod_stats_trigger(self) -> None:
+        """Keep mod_stats_counts in step with mod_stats inside the inserting statement.
+
+        Rows skipped by INSERT OR IGNORE do not fire the trigger, so a batch that is
+        written again after a failed flush cannot bump any counter twice.
+        """
+        values = ", ".join(
+            f"(NEW.guild_id, NEW.user_id, NEW.action_type, '{period}', 1)" for period in _MOD_STAT_PERIODS
+        )
+        # Recreated on every start so a change to the tracked periods takes effect
+        await self.conn.execute("DROP TRIGGER IF EXISTS trg_mod_stats_counts")
+        await self.conn.execute(
+            f"""
+            CREATE TRIGGER trg_mod_stats_counts AFTER INSERT ON mod_stats
+            BEGIN
+                INSERT INTO mod_stats_counts (guild_id, user_id, action_type, period, count)
+                VALUES {values}
+                ON CONFLICT(guild_id, user_id, action_type, period) DO UPDATE SET count = count + 1;
+            END
+            """
+        )
+
+    async def _migrate_afk_pings(self) -> None:
+        """Move pings stored in the legacy afk.pings column into afk_pings."""
+        rows = await self.conn.execute_fetchall(
+            "SELECT user_id, guild_id, timestamp, pings FROM afk WHERE pings IS NOT NULL AND pings != ''"
+        )
+        if not rows:
+            return
+        await self.conn.executemany(
+            "INSERT INTO afk_pings (user_id, guild_id, info, timestamp) VALUES (?, ?, ?, ?)",
+            [
+                (row["user_id"], row["guild_id"], info, row["timestamp"])
+                for row in rows
+                for info in row["pings"].split("|||")
+                if info.strip()
+            ],
+        )
+        await self.conn.execute("UPDATE afk SET pings = '' WHERE pings IS NOT NULL AND pings != ''")
+
+    async def _load_blacklists(self) -> None:
+        rows = await self.conn.execute_fetchall("SELECT guild_id FROM blacklisted_guilds")
+        self._blacklisted_guilds = {row[0] for row in rows}
+        rows = await self.conn.execute_fetchall("SELECT user_id FROM bot_blacklist")
+        self._blacklisted_users = {row[0] for row in rows}
 
     async def ensure_guild_settings(self, guild_id: int, *, default_prefix: str = "!") -> None:
         """Create default settings for a guild if they do not exist."""
@@ -381,13 +773,21 @@ class Database:
         await self.conn.commit()
 
     async def get_guild_settings(self, guild_id: int, *, default_prefix: str = "!") -> GuildSettings:
+        settings = self._guild_settings_cache.get(guild_id)
+        if settings is None:
+            settings = await self._load_guild_settings(guild_id, default_prefix=default_prefix)
+            self._guild_settings_cache[guild_id] = settings
+        # A blank stored prefix falls back to the caller's default
+        return settings if settings.prefix else replace(settings, prefix=default_prefix)
+
+    async def _load_guild_settings(self, guild_id: int, *, default_prefix: str) -> GuildSettings:
         await self.ensure_guild_settings(guild_id, default_prefix=default_prefix)
         async with self.conn.execute("SELECT * FROM guild_settings WHERE guild_id = ?", (guild_id,)) as cur:
             row = await cur.fetchone()
         assert row is not None
         return GuildSettings(
             guild_id=row["guild_id"],
-            prefix=row["prefix"] or default_prefix,
+            prefix=row["prefix"] or "",
             warn_duration=int(row["warn_duration"] or 14),
             modlog_channel_id=row["modlog_channel_id"],
             commands_channel_id=row["commands_channel_id"],
@@ -422,6 +822,7 @@ class Database:
         params = list(normalized.values()) + [guild_id]
         await self.conn.execute(f"UPDATE guild_settings SET {fields} WHERE guild_id = ?", params)
         await self.conn.commit()
+        self._guild_settings_cache.pop(guild_id, None)
 
     # ---------------------------------------------------------------------
     # Script update settings
@@ -496,15 +897,40 @@ class Database:
         await self.conn.commit()
         return int(cur.lastrowid)
 
+    async def add_modlog_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Insert several modlog entries in one transaction.
+
+        Each row takes the same keys as add_modlog's arguments; target_id,
+        reason and message_id may be omitted.
+        """
+        ts = utcnow().isoformat()
+        params = [
+            (
+                row["guild_id"], row["action_type"], row["user_id"], row["moderator_id"],
+                row.get("target_id"), row.get("reason"), ts, row.get("message_id"),
+            )
+            for row in rows
+        ]
+        if not params:
+            return
+        await self.conn.executemany(
+            """
+            INSERT INTO modlogs (guild_id, action_type, user_id, moderator_id, target_id, reason, timestamp, message_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            params,
+        )
+        await self.conn.commit()
+
     async def get_modlogs_for_user(self, guild_id: int, user_id: int, *, limit: int = 100) -> list[aiosqlite.Row]:
-        async with self.conn.execute(
+        async with self._reader() as conn, conn.execute(
             "SELECT * FROM modlogs WHERE guild_id = ? AND user_id = ? ORDER BY id DESC LIMIT ?",
             (guild_id, user_id, limit),
         ) as cur:
             return await cur.fetchall()
 
     async def get_modlogs_as_moderator(self, guild_id: int, moderator_id: int, *, limit: int = 50) -> list[aiosqlite.Row]:
-        async with self.conn.execute(
+        async with self._reader() as conn, conn.execute(
             "SELECT * FROM modlogs WHERE guild_id = ? AND moderator_id = ? ORDER BY id DESC LIMIT ?",
             (guild_id, moderator_id, limit),
         ) as cur:
@@ -672,7 +1098,7 @@ class Database:
         await self.conn.commit()
 
     async def get_active_staff_flags(self, *, guild_id: int, staff_user_id: int) -> list[aiosqlite.Row]:
-        async with self.conn.execute(
+        async with self._reader() as conn, conn.execute(
             """
             SELECT * FROM staff_flags
             WHERE guild_id = ? AND staff_user_id = ? AND is_active = 1
@@ -682,6 +1108,27 @@ class Database:
         ) as cur:
             return await cur.fetchall()
 
+    async def count_active_staff_flags(self, *, guild_id: int, staff_user_ids: Iterable[int]) -> dict[int, int]:
+        """Active flag counts per staff member; users without flags map to 0."""
+        out = dict.fromkeys(staff_user_ids, 0)
+        ids = list(out)
+        if not ids:
+            return out
+        async with self._reader() as conn:
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start:start + _IN_CHUNK]
+                marks = ", ".join("?" * len(chunk))
+                async with conn.execute(
+                    "SELECT staff_user_id, COUNT(*) FROM staff_flags "
+                    f"WHERE guild_id = ? AND is_active = 1 AND staff_user_id IN ({marks}) "
+                    "GROUP BY staff_user_id",
+                    [guild_id, *chunk],
+                ) as cur:
+                    cur.row_factory = None
+                    for user_id, count in await cur.fetchall():
+                        out[user_id] = count
+        return out
+
     async def get_expired_staff_flags(self, *, limit: int = 100) -> list[aiosqlite.Row]:
         now = utcnow().isoformat()
         async with self.conn.execute(
@@ -802,7 +1249,7 @@ class Database:
             INSERT INTO imprisonments (user_id, guild_id, moderator_id, roles_json, timestamp, is_active)
             VALUES (?, ?, ?, ?, ?, 1)
             """,
-            (user_id, guild_id, moderator_id, json.dumps(role_ids), ts),
+            (user_id, guild_id, moderator_id, orjson.dumps(role_ids).decode(), ts),
         )
         await self.conn.commit()
         return int(cur.lastrowid)
@@ -836,16 +1283,15 @@ class Database:
             (guild_id, reason, utcnow().isoformat()),
         )
         await self.conn.commit()
+        self._blacklisted_guilds.add(guild_id)
 
     async def unblacklist_guild(self, *, guild_id: int) -> None:
         await self.conn.execute("DELETE FROM blacklisted_guilds WHERE guild_id = ?", (guild_id,))
         await self.conn.commit()
+        self._blacklisted_guilds.discard(guild_id)
 
     async def is_guild_blacklisted(self, *, guild_id: int) -> bool:
-        async with self.conn.execute(
-            "SELECT guild_id FROM blacklisted_guilds WHERE guild_id = ?", (guild_id,)
-        ) as cur:
-            return (await cur.fetchone()) is not None
+        return guild_id in self._blacklisted_guilds
 
     async def get_blacklisted_guilds(self) -> list[aiosqlite.Row]:
         async with self.conn.execute("SELECT * FROM blacklisted_guilds ORDER BY timestamp DESC") as cur:
@@ -864,9 +1310,27 @@ class Database:
         await self.conn.commit()
 
     async def get_ai_settings(self, guild_id: int) -> AISettings:
-        await self.ensure_ai_settings(guild_id)
+        settings = self._ai_settings_cache.get(guild_id)
+        if settings is None:
+            settings = await self._load_ai_settings(guild_id)
+            self._ai_settings_cache[guild_id] = settings
+        return settings
+
+    async def _load_ai_settings(self, guild_id: int) -> AISettings:
         async with self.conn.execute("SELECT * FROM ai_settings WHERE guild_id = ?", (guild_id,)) as cur:
             row = await cur.fetchone()
+        if row is None:
+            # Create defaults and read them back in one statement
+            async with self.conn.execute(
+                """
+                INSERT INTO ai_settings (guild_id) VALUES (?)
+                ON CONFLICT(guild_id) DO UPDATE SET guild_id = excluded.guild_id
+                RETURNING *
+                """,
+                (guild_id,),
+            ) as cur:
+                row = await cur.fetchone()
+            await self.conn.commit()
         assert row is not None
         return AISettings(
             guild_id=row["guild_id"],
@@ -888,11 +1352,13 @@ class Database:
                 normalized[key] = bool(value)
             elif key == "ai_personality":
                 normalized[key] = str(value)
+        if not normalized:
+            return
         
-        fields = ", ".join(f"{k} = ?" for k in normalized)
         params = list(normalized.values()) + [guild_id]
-        await self.conn.execute(f"UPDATE ai_settings SET {fields} WHERE guild_id = ?", params)
+        await self.conn.execute(_update_sql("ai_settings", tuple(normalized)), params)
         await self.conn.commit()
+        self._ai_settings_cache.pop(guild_id, None)
 
     # ---------------------------------------------------------------------
     # AI Targets
@@ -913,32 +1379,51 @@ class Database:
 
     async def get_ai_target(self, *, user_id: int, guild_id: int) -> AITarget | None:
         """Get AI target information."""
-        async with self.conn.execute("SELECT * FROM ai_targets WHERE user_id = ? AND guild_id = ?", (user_id, guild_id)) as cur:
-            row = await cur.fetchone()
-        if row is None:
-            return None
-        return AITarget(
-            user_id=row["user_id"],
-            guild_id=row["guild_id"],
-            target_by=row["target_by"],
-            timestamp=row["timestamp"],
-            notes=row["notes"],
-        )
+        key = (user_id, guild_id)
+        fut = self._pending_ai_targets.get(key)
+        if fut is None:
+            fut = self._pending_ai_targets[key] = asyncio.get_running_loop().create_future()
+            if self._ai_target_flush is None:
+                # The task first runs after every callback already queued for this
+                # tick, so concurrent lookups share its single query.
+                self._ai_target_flush = self._spawn(self._flush_ai_targets())
+        return await asyncio.shield(fut)
+
+    async def _flush_ai_targets(self) -> None:
+        pending, self._pending_ai_targets = self._pending_ai_targets, {}
+        self._ai_target_flush = None
+        keys = list(pending)
+        found: dict[tuple[int, int], AITarget] = {}
+        try:
+            for start in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[start:start + _IN_CHUNK]
+                values = ", ".join("(?, ?)" for _ in chunk)
+                params = [v for key in chunk for v in key]
+                async with self.conn.execute(
+                    "SELECT user_id, guild_id, target_by, timestamp, notes FROM ai_targets "
+                    f"WHERE (user_id, guild_id) IN (VALUES {values})",
+                    params,
+                ) as cur:
+                    for row in await cur.fetchall():
+                        found[(row[0], row[1])] = AITarget(*row)
+        except Exception as exc:
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for key, fut in pending.items():
+            if not fut.done():
+                fut.set_result(found.get(key))
 
     async def get_all_ai_targets(self, *, guild_id: int) -> list[AITarget]:
         """Get all AI targets for a guild."""
-        async with self.conn.execute("SELECT * FROM ai_targets WHERE guild_id = ?", (guild_id,)) as cur:
+        async with self.conn.execute(
+            "SELECT user_id, guild_id, target_by, timestamp, notes FROM ai_targets WHERE guild_id = ?",
+            (guild_id,),
+        ) as cur:
             rows = await cur.fetchall()
-        return [
-            AITarget(
-                user_id=row["user_id"],
-                guild_id=row["guild_id"],
-                target_by=row["target_by"],
-                timestamp=row["timestamp"],
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        # Columns are selected in field order, so rows unpack positionally
+        return [AITarget(*row) for row in rows]
 
     # ---------------------------------------------------------------------
     # Bot Blacklist
@@ -951,16 +1436,17 @@ class Database:
             (user_id, blacklisted_by, reason, utcnow().isoformat()),
         )
         await self.conn.commit()
+        self._blacklisted_users.add(user_id)
 
     async def remove_from_blacklist(self, *, user_id: int) -> None:
         """Remove user from bot blacklist."""
         await self.conn.execute("DELETE FROM bot_blacklist WHERE user_id = ?", (user_id,))
         await self.conn.commit()
+        self._blacklisted_users.discard(user_id)
 
     async def is_blacklisted(self, *, user_id: int) -> bool:
         """Check if user is blacklisted."""
-        async with self.conn.execute("SELECT 1 FROM bot_blacklist WHERE user_id = ?", (user_id,)) as cur:
-            return await cur.fetchone() is not None
+        return user_id in self._blacklisted_users
 
     async def get_blacklist_entry(self, *, user_id: int) -> BotBlacklist | None:
         """Get blacklist entry."""
@@ -977,17 +1463,12 @@ class Database:
 
     async def get_all_blacklisted(self) -> list[BotBlacklist]:
         """Get all blacklisted users."""
-        async with self.conn.execute("SELECT * FROM bot_blacklist ORDER BY timestamp DESC") as cur:
+        async with self.conn.execute(
+            "SELECT user_id, blacklisted_by, reason, timestamp FROM bot_blacklist ORDER BY timestamp DESC"
+        ) as cur:
             rows = await cur.fetchall()
-        return [
-            BotBlacklist(
-                user_id=row["user_id"],
-                blacklisted_by=row["blacklisted_by"],
-                reason=row["reason"],
-                timestamp=row["timestamp"],
-            )
-            for row in rows
-        ]
+        # Columns are selected in field order, so rows unpack positionally
+        return [BotBlacklist(*row) for row in rows]
 
     # ---------------------------------------------------------------------
     # Timeout Settings
@@ -998,14 +1479,17 @@ class Database:
         async with self.conn.execute("SELECT * FROM timeout_settings WHERE guild_id = ?", (guild_id,)) as cur:
             row = await cur.fetchone()
         if row is None:
-            # Create default settings
-            await self.conn.execute(
-                "INSERT OR IGNORE INTO timeout_settings (guild_id) VALUES (?)",
+            # Create default settings and read them back in one statement
+            async with self.conn.execute(
+                """
+                INSERT INTO timeout_settings (guild_id) VALUES (?)
+                ON CONFLICT(guild_id) DO UPDATE SET guild_id = excluded.guild_id
+                RETURNING *
+                """,
                 (guild_id,),
-            )
-            await self.conn.commit()
-            async with self.conn.execute("SELECT * FROM timeout_settings WHERE guild_id = ?", (guild_id,)) as cur:
+            ) as cur:
                 row = await cur.fetchone()
+            await self.conn.commit()
         
         assert row is not None
         return TimeoutSettings(
@@ -1032,10 +1516,11 @@ class Database:
                 normalized[key] = int(value)
             elif key == "enabled":
                 normalized[key] = bool(value)
+        if not normalized:
+            return
         
-        fields = ", ".join(f"{k} = ?" for k in normalized)
         params = list(normalized.values()) + [guild_id]
-        await self.conn.execute(f"UPDATE timeout_settings SET {fields} WHERE guild_id = ?", params)
+        await self.conn.execute(_update_sql("timeout_settings", tuple(normalized)), params)
         await self.conn.commit()
 
     # ---------------------------------------------------------------------
@@ -1044,24 +1529,26 @@ class Database:
 
     async def get_trial_mod_roles(self, guild_id: int) -> list[int]:
         """Get trial moderator role IDs for a guild."""
-        await self.conn.execute(
-            "INSERT OR IGNORE INTO trial_mod_roles (guild_id, role_ids) VALUES (?, '')",
-            (guild_id,),
-        )
-        await self.conn.commit()
-        async with self.conn.execute("SELECT role_ids FROM trial_mod_roles WHERE guild_id = ?", (guild_id,)) as cur:
-            row = await cur.fetchone()
-        if row is None:
-            return []
-        return _csv_to_int_list(row["role_ids"])
+        cached = self._trial_mod_cache.get(guild_id)
+        if cached is None:
+            async with self.conn.execute("SELECT role_ids FROM trial_mod_roles WHERE guild_id = ?", (guild_id,)) as cur:
+                cur.row_factory = None
+                row = await cur.fetchone()
+            cached = _csv_to_int_list(row[0]) if row is not None else []
+            self._trial_mod_cache[guild_id] = cached
+        return list(cached)
 
     async def set_trial_mod_roles(self, guild_id: int, role_ids: list[int]) -> None:
         """Set trial moderator role IDs for a guild."""
         await self.conn.execute(
-            "INSERT OR REPLACE INTO trial_mod_roles (guild_id, role_ids) VALUES (?, ?)",
+            """
+            INSERT INTO trial_mod_roles (guild_id, role_ids) VALUES (?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET role_ids = excluded.role_ids
+            """,
             (guild_id, _int_list_to_csv(role_ids)),
         )
         await self.conn.commit()
+        self._trial_mod_cache[guild_id] = [int(v) for v in role_ids]
 
     # ---------------------------------------------------------------------
     # Staff Hierarchy
@@ -1069,99 +1556,97 @@ class Database:
 
     async def get_staff_hierarchy(self, guild_id: int) -> list[int]:
         """Get staff hierarchy role IDs for a guild (highest to lowest)."""
-        async with self.conn.execute("SELECT role_ids FROM staff_hierarchy WHERE guild_id = ?", (guild_id,)) as cur:
-            row = await cur.fetchone()
-        if row is None:
-            return []
-        return _csv_to_int_list(row["role_ids"])
+        cached = self._hierarchy_cache.get(guild_id)
+        if cached is None:
+            async with self.conn.execute("SELECT role_ids FROM staff_hierarchy WHERE guild_id = ?", (guild_id,)) as cur:
+                cur.row_factory = None
+                row = await cur.fetchone()
+            cached = _csv_to_int_list(row[0]) if row is not None else []
+            self._hierarchy_cache[guild_id] = cached
+        return list(cached)
 
     async def set_staff_hierarchy(self, guild_id: int, role_ids: list[int]) -> None:
         """Set staff hierarchy role IDs for a guild."""
         await self.conn.execute(
-            "INSERT OR REPLACE INTO staff_hierarchy (guild_id, role_ids) VALUES (?, ?)",
+            """
+            INSERT INTO staff_hierarchy (guild_id, role_ids) VALUES (?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET role_ids = excluded.role_ids
+            """,
             (guild_id, _int_list_to_csv(role_ids)),
         )
         await self.conn.commit()
+        self._hierarchy_cache[guild_id] = [int(v) for v in role_ids]
 
     # ---------------------------------------------------------------------
     # Mod Stats
     # ---------------------------------------------------------------------
 
     async def track_mod_action(self, *, guild_id: int, user_id: int, action_type: str) -> None:
-        """Track a moderation action for statistics."""
-        ts = utcnow().isoformat()
-        try:
-            await self.conn.execute(
-                "INSERT OR IGNORE INTO mod_stats (guild_id, user_id, action_type, timestamp) VALUES (?, ?, ?, ?)",
-                (guild_id, user_id, action_type, ts),
-            )
+        """Queue a moderation action for statistics; written by the buffered writer task."""
+        self._mod_buf.append((guild_id, user_id, action_type, utcnow().isoformat()))
+
+    async def _flush_mod_actions(self) -> None:
+        while self._mod_buf:
+            batch = [self._mod_buf.popleft() for _ in range(min(len(self._mod_buf), _WRITE_FLUSH_BATCH))]
+            # trg_mod_stats_counts bumps the counters for inserted rows only, so a
+            # requeued batch whose rows were already written is not counted again
+            try:
+                await self.conn.executemany(
+                    "INSERT OR IGNORE INTO mod_stats (guild_id, user_id, action_type, timestamp) VALUES (?, ?, ?, ?)",
+                    batch,
+                )
+            except BaseException:
+                self._mod_buf.extendleft(reversed(batch))
+                raise
             await self.conn.commit()
-        except Exception:
-            logger.exception("Failed to track mod action")
 
     async def get_mod_stats(self, guild_id: int, user_id: int) -> dict:
         """Get mod stats for a user."""
-        now = utcnow()
-        seven_days_ago = (now - timedelta(days=7)).isoformat()
-        fourteen_days_ago = (now - timedelta(days=14)).isoformat()
-        thirty_days_ago = (now - timedelta(days=30)).isoformat()
-
-        stats = {
-            'warns_7d': 0, 'warns_14d': 0, 'warns_30d': 0, 'warns_total': 0,
-            'mutes_7d': 0, 'mutes_14d': 0, 'mutes_30d': 0, 'mutes_total': 0,
-            'kicks_7d': 0, 'kicks_14d': 0, 'kicks_30d': 0, 'kicks_total': 0,
-            'bans_7d': 0, 'bans_14d': 0, 'bans_30d': 0, 'bans_total': 0,
-        }
+        stats = dict.fromkeys(_MOD_STAT_KEYS, 0)
 
-        for action in ['warns', 'mutes', 'kicks', 'bans']:
-            # Total
-            async with self.conn.execute(
-                "SELECT COUNT(*) as count FROM mod_stats WHERE guild_id = ? AND user_id = ? AND action_type = ?",
-                (guild_id, user_id, action)
-            ) as cur:
-                row = await cur.fetchone()
-                stats[f'{action}_total'] = row['count'] if row else 0
-
-            # Past 30 days
-            async with self.conn.execute(
-                "SELECT COUNT(*) as count FROM mod_stats WHERE guild_id = ? AND user_id = ? AND action_type = ? AND timestamp >= ?",
-                (guild_id, user_id, action, thirty_days_ago)
-            ) as cur:
-                row = await cur.fetchone()
-                stats[f'{action}_30d'] = row['count'] if row else 0
+        async with self.conn.execute(
+            "SELECT action_type, period, count FROM mod_stats_counts WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id),
+        ) as cur:
+            rows = await cur.fetchall()
+        for action_type, period, count in rows:
+            key = f"{action_type}_{period}"
+            if key in stats:
+                stats[key] = count
 
-            # Past 14 days
-            async with self.conn.execute(
-                "SELECT COUNT(*) as count FROM mod_stats WHERE guild_id = ? AND user_id = ? AND action_type = ? AND timestamp >= ?",
-                (guild_id, user_id, action, fourteen_days_ago)
-            ) as cur:
-                row = await cur.fetchone()
-                stats[f'{action}_14d'] = row['count'] if row else 0
+        return stats
 
-            # Past 7 days
+    async def get_staff_perf_bulk(self, guild_id: int, user_ids: Iterable[int]) -> dict[int, dict]:
+        """7d/30d action counters plus ``total_7d``/``total_30d`` per user, aggregated in SQL."""
+        out = {user_id: dict.fromkeys(_STAFF_PERF_KEYS, 0) for user_id in user_ids}
+        ids = list(out)
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            marks = ", ".join("?" * len(chunk))
             async with self.conn.execute(
-                "SELECT COUNT(*) as count FROM mod_stats WHERE guild_id = ? AND user_id = ? AND action_type = ? AND timestamp >= ?",
-                (guild_id, user_id, action, seven_days_ago)
+                f"{_STAFF_PERF_SELECT} WHERE guild_id = ? AND period IN ('7d', '30d') "
+                f"AND user_id IN ({marks}) GROUP BY user_id",
+                [guild_id, *chunk],
             ) as cur:
-                row = await cur.fetchone()
-                stats[f'{action}_7d'] = row['count'] if row else 0
-
-        return stats
+                cur.row_factory = None
+                for user_id, *counts in await cur.fetchall():
+                    out[user_id] = {key: count or 0 for key, count in zip(_STAFF_PERF_KEYS, counts)}
+        return out
 
-    async def get_all_staff_rankings(self, guild_id: int) -> list[dict]:
-        """Get all staff ranked by total mod actions."""
+    async def get_all_staff_rankings(self, guild_id: int) -> list[tuple[int, int]]:
+        """Get all staff ranked by total mod actions as ``(user_id, total)`` pairs."""
         async with self.conn.execute(
             """
-            SELECT user_id, COUNT(*) as total 
-            FROM mod_stats 
-            WHERE guild_id = ? 
+            SELECT user_id, SUM(count) as total 
+            FROM mod_stats_counts 
+            WHERE guild_id = ? AND period = 'total' 
             GROUP BY user_id 
             ORDER BY total DESC
             """,
             (guild_id,)
         ) as cur:
             rows = await cur.fetchall()
-        return [{'user_id': row['user_id'], 'total': row['total']} for row in rows]
+        return [(row[0], row[1]) for row in rows]
 
     async def set_mod_stat(self, *, guild_id: int, user_id: int, action_type: str, period: str, value: int) -> None:
         """Manually set a mod stat value."""
@@ -1228,7 +1713,227 @@ class Database:
                     """,
                     (guild_id, user_id, action_type, cutoff, abs(diff))
                 )
-        
+
+        await self.conn.executemany(
+            """
+            INSERT INTO mod_stats_counts (guild_id, user_id, action_type, period, count)
+            VALUES (?, ?, ?, ?, (
+                SELECT COUNT(*) FROM mod_stats
+                WHERE guild_id = ? AND user_id = ? AND action_type = ? AND timestamp >= ?
+            ))
+            ON CONFLICT(guild_id, user_id, action_type, period) DO UPDATE SET count = excluded.count
+            """,
+            [
+                (guild_id, user_id, action_type, p, guild_id, user_id, action_type, cutoff)
+                for p, cutoff in self._mod_stat_cutoffs(now, include_total=True)
+            ],
+        )
+        await self.conn.commit()
+
+    @staticmethod
+    def _mod_stat_cutoffs(now: datetime, *, include_total: bool) -> list[tuple[str, str]]:
+        cutoffs = [(p, (now - timedelta(days=d)).isoformat()) for p, d in _MOD_STAT_WINDOWS.items()]
+        if include_total:
+            # Every ISO timestamp sorts after the empty string.
+            cutoffs.append(("total", ""))
+        return cutoffs
+
+    async def refresh_mod_stat_counts(self, *, include_total: bool = False) -> None:
+        """Recompute mod_stats_counts from mod_stats so aged actions leave the rolling windows."""
+        for period, cutoff in self._mod_stat_cutoffs(utcnow(), include_total=include_total):
+            await self.conn.execute("UPDATE mod_stats_counts SET count = 0 WHERE period = ?", (period,))
+            await self.conn.execute(
+                """
+                INSERT INTO mod_stats_counts (guild_id, user_id, action_type, period, count)
+                SELECT guild_id, user_id, action_type, ?, COUNT(*) FROM mod_stats
+                WHERE timestamp >= ?
+                GROUP BY guild_id, user_id, action_type
+                ON CONFLICT(guild_id, user_id, action_type, period) DO UPDATE SET count = excluded.count
+                """,
+                (period, cutoff),
+            )
+            await self.conn.execute("DELETE FROM mod_stats_counts WHERE period = ? AND count = 0", (period,))
+        await self.conn.commit()
+
+    # ---------------------------------------------------------------------
+    # Promotion Suggestions
+    # ---------------------------------------------------------------------
+
+    async def add_promotion_suggestion(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        suggestion_type: str,
+        current_role: str | None,
+        suggested_role: str | None,
+        confidence: float,
+        reason: str | None,
+        metrics: str | None,
+    ) -> int:
+        """Store a pending promotion suggestion or demotion warning and return its ID."""
+        cur = await self.conn.execute(
+            """
+            INSERT INTO promotion_suggestions
+            (guild_id, user_id, suggestion_type, current_role, suggested_role, confidence, reason, metrics, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                guild_id, user_id, suggestion_type, current_role, suggested_role,
+                confidence, reason, metrics, _iso_now(),
+            ),
+        )
+        await self.conn.commit()
+        # lastrowid is read from the sqlite3 cursor directly, without another thread hop
+        return int(cur.lastrowid)
+
+    async def add_promotion_suggestions_bulk(
+        self, rows: Iterable[tuple[Any, ...]]
+    ) -> list[tuple[int, str]]:
+        """Store many suggestions in one transaction.
+
+        Each row is ``(guild_id, user_id, suggestion_type, current_role,
+        suggested_role, confidence, reason, metrics)``. Returns
+        ``(id, suggestion_type)`` for every inserted row.
+        """
+        now = _iso_now()
+        rows = [(*row, now) for row in rows]
+        if not rows:
+            return []
+        inserted: list[tuple[int, str]] = []
+        for start in range(0, len(rows), _IN_CHUNK):
+            chunk = rows[start:start + _IN_CHUNK]
+            values = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+            async with self.conn.execute(
+                f"""
+                INSERT INTO promotion_suggestions
+                (guild_id, user_id, suggestion_type, current_role, suggested_role, confidence, reason, metrics, timestamp)
+                VALUES {values}
+                RETURNING id, suggestion_type
+                """,
+                [v for row in chunk for v in row],
+            ) as cur:
+                cur.row_factory = None
+                inserted.extend((int(i), t) for i, t in await cur.fetchall())
+        await self.conn.commit()
+        return inserted
+
+    async def get_pending_suggestions(self, guild_id: int) -> list[aiosqlite.Row]:
+        """Get pending suggestions for a guild, newest first."""
+        async with self._reader() as conn, conn.execute(
+            """
+            SELECT * FROM promotion_suggestions
+            WHERE guild_id = ? AND status = 'pending'
+            ORDER BY timestamp DESC
+            """,
+            (guild_id,),
+        ) as cur:
+            return await cur.fetchall()
+
+    async def get_suggestion(self, suggestion_id: int) -> aiosqlite.Row | None:
+        async with self._reader() as conn, conn.execute(
+            "SELECT * FROM promotion_suggestions WHERE id = ?", (suggestion_id,)
+        ) as cur:
+            return await cur.fetchone()
+
+    async def get_user_suggestions(self, guild_id: int, user_id: int, *, limit: int = 10) -> list[aiosqlite.Row]:
+        """Get a staff member's most recent suggestions of any status."""
+        async with self._reader() as conn, conn.execute(
+            """
+            SELECT * FROM promotion_suggestions
+            WHERE guild_id = ? AND user_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (guild_id, user_id, limit),
+        ) as cur:
+            return await cur.fetchall()
+
+    async def review_suggestion(self, suggestion_id: int, reviewer_id: int, status: str) -> None:
+        """Mark a suggestion as approved or denied."""
+        await self.conn.execute(
+            "UPDATE promotion_suggestions SET status = ?, reviewed_by = ?, reviewed_at = ? WHERE id = ?",
+            (status, reviewer_id, _iso_now(), suggestion_id),
+        )
+        await self._group_commit()
+
+    # ---------------------------------------------------------------------
+    # Shift Configs
+    # ---------------------------------------------------------------------
+
+    async def set_shift_config(
+        self, *, guild_id: int, role_id: int, shift_type: str, afk_timeout: int, weekly_quota: int
+    ) -> None:
+        """Set the shift type, AFK timeout and weekly quota for a role."""
+        await self.conn.execute(
+            """
+            INSERT INTO shift_configs (guild_id, role_id, shift_type, afk_timeout, weekly_quota)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id, role_id) DO UPDATE SET
+                shift_type = excluded.shift_type,
+                afk_timeout = excluded.afk_timeout,
+                weekly_quota = excluded.weekly_quota
+            """,
+            (guild_id, role_id, shift_type, afk_timeout, weekly_quota),
+        )
+        await self._group_commit()
+
+    async def get_shift_config(self, guild_id: int, role_id: int) -> aiosqlite.Row | None:
+        """Get the shift config for a role."""
+        async with self._reader() as conn, conn.execute(
+            "SELECT * FROM shift_configs WHERE guild_id = ? AND role_id = ?", (guild_id, role_id)
+        ) as cur:
+            return await cur.fetchone()
+
+    # ---------------------------------------------------------------------
+    # Quota Tracking
+    # ---------------------------------------------------------------------
+
+    async def get_quota_tracking(
+        self, user_id: int, guild_id: int, shift_type: str, week_gmt8: str
+    ) -> aiosqlite.Row | None:
+        """Get a staff member's logged hours for one shift type and GMT+8 week."""
+        async with self._reader() as conn, conn.execute(
+            """
+            SELECT * FROM quota_tracking
+            WHERE user_id = ? AND guild_id = ? AND shift_type = ? AND week_gmt8 = ?
+            """,
+            (user_id, guild_id, shift_type, week_gmt8),
+        ) as cur:
+            return await cur.fetchone()
+
+    async def update_quota_tracking(
+        self,
+        *,
+        user_id: int,
+        guild_id: int,
+        shift_type: str,
+        week_gmt8: str,
+        hours_logged: float,
+        quota_met: bool,
+    ) -> None:
+        """Store the week's running hour total and whether the quota is met."""
+        await self.update_quota_tracking_bulk(
+            [(user_id, guild_id, shift_type, week_gmt8, hours_logged, quota_met)]
+        )
+
+    async def update_quota_tracking_bulk(self, rows: list[tuple]) -> None:
+        """Store many quota rows in one transaction.
+
+        Each row is ``(user_id, guild_id, shift_type, week_gmt8, hours_logged, quota_met)``.
+        """
+        if not rows:
+            return
+        await self.conn.executemany(
+            """
+            INSERT INTO quota_tracking (user_id, guild_id, shift_type, week_gmt8, hours_logged, quota_met)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, guild_id, shift_type, week_gmt8) DO UPDATE SET
+                hours_logged = excluded.hours_logged,
+                quota_met = excluded.quota_met
+            """,
+            [(*row[:5], int(row[5])) for row in rows],
+        )
         await self.conn.commit()
 
     # ---------------------------------------------------------------------
@@ -1239,15 +1944,16 @@ class Database:
         """Set a user as AFK."""
         ts = utcnow().isoformat()
         await self.conn.execute(
-            "INSERT OR REPLACE INTO afk (user_id, guild_id, reason, timestamp, pings) VALUES (?, ?, ?, ?, '')",
+            "INSERT OR REPLACE INTO afk (user_id, guild_id, reason, timestamp) VALUES (?, ?, ?, ?)",
             (user_id, guild_id, reason or "AFK", ts),
         )
+        await self.conn.execute("DELETE FROM afk_pings WHERE user_id = ? AND guild_id = ?", (user_id, guild_id))
         await self.conn.commit()
 
     async def remove_afk(self, *, user_id: int, guild_id: int) -> tuple[str, list[str]] | None:
         """Remove AFK status and return reason + pings."""
         async with self.conn.execute(
-            "SELECT reason, pings FROM afk WHERE user_id = ? AND guild_id = ?",
+            "SELECT reason FROM afk WHERE user_id = ? AND guild_id = ?",
             (user_id, guild_id)
         ) as cur:
             row = await cur.fetchone()
@@ -1256,10 +1962,14 @@ class Database:
             return None
         
         reason = row['reason']
-        pings_str = row['pings'] or ''
-        pings = [p for p in pings_str.split('|||') if p.strip()]
+        async with self.conn.execute(
+            "SELECT info FROM afk_pings WHERE user_id = ? AND guild_id = ? ORDER BY id ASC",
+            (user_id, guild_id)
+        ) as cur:
+            pings = [ping['info'] for ping in await cur.fetchall()]
         
         await self.conn.execute("DELETE FROM afk WHERE user_id = ? AND guild_id = ?", (user_id, guild_id))
+        await self.conn.execute("DELETE FROM afk_pings WHERE user_id = ? AND guild_id = ?", (user_id, guild_id))
         await self.conn.commit()
         
         return reason, pings
@@ -1279,43 +1989,209 @@ class Database:
 
     async def add_afk_ping(self, *, user_id: int, guild_id: int, ping_info: str) -> None:
         """Add a ping to AFK user's record."""
+        await self.conn.execute(
+            """
+            INSERT INTO afk_pings (user_id, guild_id, info, timestamp)
+            SELECT ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM afk WHERE user_id = ? AND guild_id = ?)
+            """,
+            (user_id, guild_id, ping_info, utcnow().isoformat(), user_id, guild_id)
+        )
+        await self.conn.commit()
+
+    # ---------------------------------------------------------------------
+    # Reminders
+    # ---------------------------------------------------------------------
+
+    async def add_reminder(self, *, user_id: int, guild_id: int, text: str, expiration_ts: str) -> int:
+        """Create a reminder that fires at ``expiration_ts`` (ISO format)."""
+        cur = await self.conn.execute(
+            """
+            INSERT INTO reminders (user_id, guild_id, text, expiration_ts, is_active)
+            VALUES (?, ?, ?, ?, 1)
+            """,
+            (user_id, guild_id, text, expiration_ts),
+        )
+        await self.conn.commit()
+        return int(cur.lastrowid)
+
+    async def get_active_reminders(self, user_id: int) -> list[aiosqlite.Row]:
+        """Get a user's active reminders, soonest first."""
         async with self.conn.execute(
-            "SELECT pings FROM afk WHERE user_id = ? AND guild_id = ?",
-            (user_id, guild_id)
+            "SELECT * FROM reminders WHERE user_id = ? AND is_active = 1 ORDER BY expiration_ts ASC",
+            (user_id,),
         ) as cur:
-            row = await cur.fetchone()
-        
-        if row is None:
+            return await cur.fetchall()
+
+    async def get_expired_reminders(self, *, limit: int = 100) -> list[aiosqlite.Row]:
+        now = utcnow().isoformat()
+        async with self.conn.execute(
+            "SELECT * FROM reminders WHERE is_active = 1 AND expiration_ts <= ? ORDER BY expiration_ts ASC LIMIT ?",
+            (now, limit),
+        ) as cur:
+            return await cur.fetchall()
+
+    async def expire_reminder_ids(self, reminder_ids: list[int]) -> None:
+        if not reminder_ids:
             return
-        
-        current_pings = row['pings'] or ''
-        new_pings = f"{current_pings}|||{ping_info}" if current_pings else ping_info
-        
-        await self.conn.execute(
-            "UPDATE afk SET pings = ? WHERE user_id = ? AND guild_id = ?",
-            (new_pings, user_id, guild_id)
-        )
+        placeholders = ",".join("?" for _ in reminder_ids)
+        await self.conn.execute(f"UPDATE reminders SET is_active = 0 WHERE id IN ({placeholders})", reminder_ids)
         await self.conn.commit()
 
+    async def delete_reminder(self, reminder_id: int, user_id: int) -> bool:
+        """Delete a reminder owned by ``user_id``. Returns False if none matched."""
+        async with self.conn.execute(
+            "DELETE FROM reminders WHERE id = ? AND user_id = ? RETURNING id",
+            (reminder_id, user_id),
+        ) as cur:
+            row = await cur.fetchone()
+        await self.conn.commit()
+        return row is not None
+
     # ---------------------------------------------------------------------
-    # Trial Mod Roles
+    # DM Notifications
     # ---------------------------------------------------------------------
 
-    async def get_trial_mod_roles(self, guild_id: int) -> list[int]:
-        """Get trial moderator role IDs for a guild."""
-        async with self.conn.execute("SELECT role_ids FROM trial_mod_roles WHERE guild_id = ?", (guild_id,)) as cur:
+    async def get_dm_notification_settings(self, guild_id: int) -> DMNotificationSettings:
+        """Get DM notification settings for a guild, creating defaults if missing."""
+        cached = self._dm_settings_cache.get(guild_id)
+        if cached is not None:
+            return cached
+        async with self.conn.execute(
+            """
+            SELECT guild_id, enabled, notify_warns, notify_mutes, notify_kicks, notify_bans, notify_flags
+            FROM dm_notification_settings WHERE guild_id = ?
+            """,
+            (guild_id,),
+        ) as cur:
+            cur.row_factory = None  # columns follow DMNotificationSettings field order
             row = await cur.fetchone()
         if row is None:
-            return []
-        return _csv_to_int_list(row["role_ids"])
+            # Create defaults and read them back in one statement
+            async with self.conn.execute(
+                """
+                INSERT INTO dm_notification_settings (guild_id) VALUES (?)
+                ON CONFLICT(guild_id) DO UPDATE SET guild_id = excluded.guild_id
+                RETURNING guild_id, enabled, notify_warns, notify_mutes, notify_kicks, notify_bans, notify_flags
+                """,
+                (guild_id,),
+            ) as cur:
+                cur.row_factory = None
+                row = await cur.fetchone()
+            await self.conn.commit()
+        assert row is not None
+        g, enabled, warns, mutes, kicks, bans, flags = row
+        settings = DMNotificationSettings(
+            g, bool(enabled), bool(warns), bool(mutes), bool(kicks), bool(bans), bool(flags)
+        )
+        self._dm_settings_cache[guild_id] = settings
+        return settings
 
-    async def set_trial_mod_roles(self, guild_id: int, role_ids: list[int]) -> None:
-        """Set trial moderator role IDs for a guild."""
+    async def update_dm_notification_settings(self, guild_id: int, **kwargs: Any) -> None:
+        """Update DM notification settings with validated values."""
+        if not kwargs:
+            return
+
+        normalized = {k: int(bool(v)) for k, v in kwargs.items() if k in _DM_FIELDS}
+        if not normalized:
+            return
+
+        # Make sure the row exists so the UPDATE has something to change
+        await self.get_dm_notification_settings(guild_id)
+        fields, sql = _DM_UPDATE_SQL[frozenset(normalized)]
+        params = [normalized[f] for f in fields] + [guild_id]
+        await self.conn.execute(sql, params)
+        await self.conn.commit()
+        self._dm_settings_cache.pop(guild_id, None)
+
+    def _cached_dm_preference(self, key: tuple[int, int]) -> bool | None:
+        entry = self._dm_pref_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._dm_pref_cache[key]
+            return None
+        return entry[0]
+
+    def _cache_dm_preference(self, key: tuple[int, int], receive: bool, gen: int) -> None:
+        # A set_dm_preference that committed while this value was being read
+        # makes it stale; leave the slot empty so the next read sees the write
+        if gen != self._dm_pref_gen:
+            return
+        if len(self._dm_pref_cache) >= _DM_PREF_CACHE_SIZE:
+            del self._dm_pref_cache[next(iter(self._dm_pref_cache))]
+        self._dm_pref_cache[key] = (receive, time.monotonic() + _DM_PREF_TTL)
+
+    async def get_dm_preference(self, user_id: int, guild_id: int) -> bool:
+        """Return whether a user wants moderation DMs in a guild (defaults to True)."""
+        key = (user_id, guild_id)
+        cached = self._cached_dm_preference(key)
+        if cached is not None:
+            return cached
+        gen = self._dm_pref_gen
+        async with self._reader() as conn, conn.execute(
+            "SELECT receive_dms FROM dm_preferences WHERE user_id = ? AND guild_id = ?", (user_id, guild_id)
+        ) as cur:
+            cur.row_factory = None  # single column, read positionally
+            row = await cur.fetchone()
+        receive = bool(row[0]) if row else True
+        self._cache_dm_preference(key, receive, gen)
+        return receive
+
+    async def set_dm_preference(self, user_id: int, guild_id: int, receive_dms: bool) -> None:
+        """Set whether a user wants moderation DMs in a guild."""
         await self.conn.execute(
-            "INSERT OR REPLACE INTO trial_mod_roles (guild_id, role_ids) VALUES (?, ?)",
-            (guild_id, _int_list_to_csv(role_ids)),
+            """
+            INSERT INTO dm_preferences (user_id, guild_id, receive_dms) VALUES (?, ?, ?)
+            ON CONFLICT(user_id, guild_id) DO UPDATE SET receive_dms = excluded.receive_dms
+            """,
+            (user_id, guild_id, int(receive_dms)),
         )
+        await self._group_commit()
+        self._dm_pref_gen += 1
+        self._dm_pref_cache.pop((user_id, guild_id), None)
+
+    async def log_dm_notification(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        action_type: str,
+        success: bool,
+        reason: str | None = None,
+    ) -> None:
+        """Queue a DM delivery attempt for the log; written by the buffered writer task."""
+        self._dm_log_buf.append(
+            (guild_id, user_id, action_type, _iso_now(), int(success), reason)
+        )
+
+    async def prune_dm_notification_log(self, *, older_than_days: int = 90, limit: int = 5000) -> int:
+        """Delete up to ``limit`` log rows older than the retention window; returns the count."""
+        cutoff = (utcnow() - timedelta(days=older_than_days)).isoformat()
+        # Rows are appended in time order, so the oldest sit at the start of the rowid B-tree
+        async with self.conn.execute(
+            """
+            DELETE FROM dm_notification_log WHERE id IN (
+                SELECT id FROM dm_notification_log WHERE timestamp < ? ORDER BY id LIMIT ?
+            )
+            """,
+            (cutoff, limit),
+        ) as cur:
+            deleted = cur.rowcount
         await self.conn.commit()
+        return deleted
+
+    async def _flush_dm_log(self) -> None:
+        while self._dm_log_buf:
+            batch = [self._dm_log_buf.popleft() for _ in range(min(len(self._dm_log_buf), _WRITE_FLUSH_BATCH))]
+            await self.conn.executemany(
+                """
+                INSERT INTO dm_notification_log (guild_id, user_id, action_type, timestamp, success, reason)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                batch,
+            )
+            await self.conn.commit()
 
     # ---------------------------------------------------------------------
     # Bot Settings
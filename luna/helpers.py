@@ -21,7 +21,7 @@ import re
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 import aiosqlite
 import discord
@@ -34,7 +34,8 @@ logger = logging.getLogger(__name__)
 
 
 _ID_RE = re.compile(r"(\d{15,25})")
-_DURATION_RE = re.compile(r"^(\d{1,9})([smhd])$", re.IGNORECASE)
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_AI_LEAK_RE = re.compile(r"(You are|User:|AI:|Human:|Assistant:).*$", re.MULTILINE)
 
 
 def utcnow() -> datetime:
@@ -44,6 +45,13 @@ def utcnow() -> datetime:
 def extract_id(value: str) -> int | None:
     """Extract a Discord snowflake from a mention or raw string."""
 
+    # Fast path for a bare ID or a <@id>/<@!id>/<@&id>/<#id> mention; anything else uses the regex
+    body = value
+    if value.startswith("<") and value.endswith(">"):
+        body = value[1:-1].lstrip("@!&#")
+    if 15 <= len(body) <= 25 and body.isdecimal():
+        return int(body)
+
     match = _ID_RE.search(value)
     if not match:
         return None
@@ -74,14 +82,12 @@ def parse_duration(value: str) -> int:
     """
 
     value = value.strip().lower()
-    match = _DURATION_RE.match(value)
-    if not match:
+    # Single pass: a 1-9 digit amount followed by exactly one unit char
+    mult = _DURATION_UNITS.get(value[-1:])
+    amount = value[:-1]
+    if mult is None or not 0 < len(amount) <= 9 or not amount.isdecimal():
         raise ValueError("Invalid duration format")
-    amount = int(match.group(1))
-    unit = match.group(2).lower()
-
-    mult = {"s": 1, "m": 60, "h": 3600, "d": 86400}[unit]
-    return amount * mult
+    return int(amount) * mult
 
 
 def humanize_seconds(seconds: int) -> str:
@@ -89,10 +95,11 @@ def humanize_seconds(seconds: int) -> str:
 
     if seconds <= 0:
         return "0s"
+    if seconds < 60:
+        return f"{seconds}s"
 
-    delta = timedelta(seconds=seconds)
-    days = delta.days
-    hours, rem = divmod(delta.seconds, 3600)
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
     minutes, secs = divmod(rem, 60)
 
     parts: list[str] = []
@@ -107,15 +114,17 @@ def humanize_seconds(seconds: int) -> str:
     return " ".join(parts)
 
 
-def to_unix_timestamp(dt: datetime | str) -> int:
-    """Convert datetime or ISO string to Unix timestamp."""
+def to_unix_timestamp(dt: datetime | str | float) -> int:
+    """Convert datetime, ISO string or epoch seconds to Unix timestamp."""
+    if isinstance(dt, (int, float)):
+        return int(dt)
     if isinstance(dt, str):
         dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
     return int(dt.timestamp())
 
 
-def discord_timestamp(dt: datetime | str, style: str = "f") -> str:
-    """Convert datetime or ISO string to Discord timestamp format.
+def discord_timestamp(dt: datetime | str | float, style: str = "f") -> str:
+    """Convert datetime, ISO string or epoch seconds to Discord timestamp format.
     
     Styles:
     - t: Short Time (16:20)
@@ -133,23 +142,18 @@ def discord_timestamp(dt: datetime | str, style: str = "f") -> str:
 def is_admin_member(member: discord.Member, settings: GuildSettings) -> bool:
     if member.guild_permissions.administrator:
         return True
-    if settings.admin_role_ids and any(r.id in settings.admin_role_ids for r in member.roles):
-        return True
-    return False
+    return has_any_role(member, settings.admin_role_ids)
 
 
 def is_staff_member(member: discord.Member, settings: GuildSettings) -> bool:
-    ids = set(settings.staff_role_ids)
-    if not ids:
-        return False
-    return any(r.id in ids for r in member.roles)
+    return has_any_role(member, settings.staff_role_ids)
 
 
-def has_any_role(member: discord.Member, role_ids: Sequence[int]) -> bool:
-    ids = set(role_ids)
-    if not ids:
-        return False
-    return any(r.id in ids for r in member.roles)
+def has_any_role(member: discord.Member, role_ids: Iterable[int]) -> bool:
+    # Member.get_role bisects the member's sorted role snowflakes, so this
+    # avoids building and sorting the full member.roles list on every check.
+    get_role = member.get_role
+    return any(get_role(role_id) is not None for role_id in role_ids)
 
 
 def role_level_for_member(
@@ -177,7 +181,7 @@ def role_level_for_member(
 async def is_trial_mod(member: discord.Member, db) -> bool:
     """Check if member is a trial moderator."""
     trial_roles = await db.get_trial_mod_roles(member.guild.id)
-    return any(r.id in trial_roles for r in member.roles)
+    return has_any_role(member, trial_roles)
 
 
 def get_user_type(member: discord.Member, settings: GuildSettings) -> str:
@@ -251,7 +255,7 @@ def check_staff_immunity_with_override(
         + settings.moderator_role_ids
         + list(trial_mod_role_ids)
     )
-    is_target_staff = any(r.id in staff_ids for r in target.roles)
+    is_target_staff = has_any_role(target, staff_ids)
     is_target_admin = target.guild_permissions.administrator
     
     # If target is not staff and not admin, no immunity check needed
@@ -265,7 +269,7 @@ def check_staff_immunity_with_override(
     # Check if executor is admin (normal admin, not owner)
     is_executor_admin = (
         executor.guild_permissions.administrator
-        or any(r.id in settings.admin_role_ids for r in executor.roles)
+        or has_any_role(executor, settings.admin_role_ids)
     )
     
     # Admins can moderate staff (but this is NOT an override, it's normal behavior)
@@ -320,20 +324,57 @@ async def safe_dm(user: discord.abc.User, *, content: str | None = None, embed:
         logger.exception("Failed to DM user %s", getattr(user, "id", "?"))
 
 
-async def add_loading_reaction(message: discord.Message) -> None:
-    """Add a loading reaction (🔃) to indicate processing."""
+# Strong refs to fire-and-forget tasks so they are not garbage-collected mid-flight
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _spawn(coro: Any) -> asyncio.Task[None]:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def fire_safe_dm(user: discord.abc.User, *, content: str | None = None, embed: discord.Embed | None = None) -> None:
+    """Schedule safe_dm without waiting for it; for loops where delivery order does not matter."""
+    _spawn(safe_dm(user, content=content, embed=embed))
+
+
+async def _add_loading_reaction(message: discord.Message) -> None:
     try:
         await message.add_reaction("🔃")
     except Exception:
         logger.debug("Failed to add loading reaction")
 
 
+def add_loading_reaction(message: discord.Message) -> asyncio.Task[None]:
+    """Add a loading reaction (🔃) to indicate processing.
+
+    The reaction is sent as a tracked background task so the command does not
+    wait on the round-trip; await the returned task if ordering matters.
+    """
+    return _spawn(_add_loading_reaction(message))
+
+
+# (epoch second, aware datetime) shared by embeds built within the same second
+_embed_ts_cache: tuple[int, datetime] = (0, datetime.fromtimestamp(0, tz=timezone.utc))
+
+
+def _embed_timestamp() -> datetime:
+    """Current UTC time truncated to the second; Discord renders no finer."""
+    global _embed_ts_cache
+    now = int(time.time())
+    if _embed_ts_cache[0] != now:
+        _embed_ts_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc))
+    return _embed_ts_cache[1]
+
+
 def make_embed(*, action: str, title: str, description: str | None = None) -> discord.Embed:
     embed = discord.Embed(
         title=title,
         description=description or "",
         color=config.get_embed_color(action),
-        timestamp=utcnow(),
+        timestamp=_embed_timestamp(),
     )
     embed.set_footer(text=config.BOT_NAME)
     return embed
@@ -393,7 +434,7 @@ async def notify_owner_mod_action(
         logger.exception("Failed to fetch owner for mod action notification")
         return
     
-    timestamp_str = discord_timestamp(utcnow())
+    timestamp_str = discord_timestamp(time.time())
     
     description_parts = [
         f"**Server:** {guild.name} (`{guild.id}`)",
@@ -466,8 +507,17 @@ def commands_channel_check() -> commands.Check:
     return commands.check(predicate)
 
 
+_LEVELS = {"member": 0, "trial_mod": 1, "moderator": 2, "senior_mod": 3, "head_mod": 4, "admin": 5}
+
+
+async def _deny_permission(ctx: commands.Context) -> bool:
+    embed = make_embed(action="error", title="No Permission", description="You don't have permission to use this command.")
+    await ctx.send(embed=embed)
+    return False
+
+
 def require_level(min_level: str) -> commands.Check:
-    levels = {"member": 0, "trial_mod": 1, "moderator": 2, "senior_mod": 3, "head_mod": 4, "admin": 5}
+    needed = _LEVELS[min_level]
 
     async def predicate(ctx: commands.Context) -> bool:
         if ctx.guild is None or not isinstance(ctx.author, discord.Member):
@@ -475,13 +525,14 @@ def require_level(min_level: str) -> commands.Check:
         db = getattr(ctx.bot, "db", None)
         if db is None:
             return False
+        # Administrators (incl. the guild owner) pass every level; skip the settings lookup
+        if ctx.author.guild_permissions.administrator:
+            return True
         settings: GuildSettings = await db.get_guild_settings(ctx.guild.id, default_prefix=config.DEFAULT_PREFIX)
         trial_mod_roles = await db.get_trial_mod_roles(ctx.guild.id)
         have = role_level_for_member(ctx.author, settings, trial_mod_role_ids=trial_mod_roles)
-        if levels[have] < levels[min_level]:
-            embed = make_embed(action="error", title="No Permission", description="You don't have permission to use this command.")
-            await ctx.send(embed=embed)
-            return False
+        if _LEVELS[have] < needed:
+            return await _deny_permission(ctx)
         return True
 
     return commands.check(predicate)
@@ -494,19 +545,21 @@ def require_admin() -> commands.Check:
         db = getattr(ctx.bot, "db", None)
         if db is None:
             return False
+        # Administrators (incl. the guild owner) pass every level; skip the settings lookup
+        if ctx.author.guild_permissions.administrator:
+            return True
         settings: GuildSettings = await db.get_guild_settings(ctx.guild.id, default_prefix=config.DEFAULT_PREFIX)
         if not is_admin_member(ctx.author, settings):
-            embed = make_embed(action="error", title="No Permission", description="You don't have permission to use this command.")
-            await ctx.send(embed=embed)
-            return False
+            return await _deny_permission(ctx)
         return True
 
     return commands.check(predicate)
 
 
 def require_owner() -> commands.Check:
-    async def predicate(ctx: commands.Context) -> bool:
-        return ctx.author.id == config.OWNER_ID if config.OWNER_ID else False
+    # Plain function: commands.check accepts sync predicates, so no coroutine per call
+    def predicate(ctx: commands.Context) -> bool:
+        return is_owner(ctx.author.id)
 
     return commands.check(predicate)
 
@@ -574,6 +627,36 @@ async def timed_rest_call(coro: Any) -> tuple[Any, float]:
     return result, (time.perf_counter() - start) * 1000.0
 
 
+# ---------------------------------------------------------------------------
+# Shift Helpers (GMT+8)
+# ---------------------------------------------------------------------------
+
+# Fixed offset; built once instead of per conversion
+_SHIFT_TZ = timezone(timedelta(hours=config.SHIFT_TIMEZONE_OFFSET))
+
+
+def get_gmt8_now() -> datetime:
+    """Current time in the shift timezone (GMT+8)."""
+    return datetime.now(_SHIFT_TZ)
+
+
+def format_shift_time(dt: datetime) -> str:
+    """Format a timestamp in the shift timezone."""
+    return dt.astimezone(_SHIFT_TZ).strftime("%Y-%m-%d %H:%M GMT+8")
+
+
+def calculate_shift_hours(start: datetime, end: datetime, break_minutes: int = 0) -> float:
+    """Hours worked between start and end, minus breaks; never negative."""
+    seconds = (end - start).total_seconds() - break_minutes * 60
+    return max(seconds, 0.0) / 3600.0
+
+
+def get_week_identifier_gmt8(dt: datetime) -> str:
+    """ISO week identifier (e.g. ``2024-W07``) of a timestamp in GMT+8."""
+    year, week, _ = dt.astimezone(_SHIFT_TZ).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
 # ---------------------------------------------------------------------------
 # AI Chatbot Helpers
 # ---------------------------------------------------------------------------
@@ -614,13 +697,27 @@ def truncate_response(text: str, max_length: int = config.MAX_RESPONSE_LENGTH) -
     if len(text) <= max_length:
         return text
     
-    # Try to truncate at a word boundary
-    truncated = text[:max_length-3]
-    last_space = truncated.rfind(' ')
+    # Try to truncate at a word boundary; rfind within the bound avoids an intermediate slice
+    cut = max_length - 3
+    last_space = text.rfind(' ', 0, cut)
     if last_space > max_length * 0.7:  # Only truncate at word if it's reasonable
-        truncated = truncated[:last_space]
+        cut = last_space
     
-    return truncated + "..."
+    return f"{text[:cut]}..."
+
+
+_gemini_model: Any = None
+
+
+def _get_gemini_model() -> Any:
+    """Configure the Gemini SDK and build the model once, on first use."""
+    global _gemini_model
+    if _gemini_model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=config.GEMINI_API_KEY)
+        _gemini_model = genai.GenerativeModel(config.GEMINI_MODEL)
+    return _gemini_model
 
 
 async def get_ai_response(user_message: str, personality: str = "genz") -> str:
@@ -629,13 +726,7 @@ async def get_ai_response(user_message: str, personality: str = "genz") -> str:
         raise ValueError("GEMINI_API_KEY not configured")
     
     try:
-        import google.generativeai as genai
-        
-        # Configure the API
-        genai.configure(api_key=config.GEMINI_API_KEY)
-        
-        # Create the model
-        model = genai.GenerativeModel(config.GEMINI_MODEL)
+        model = _get_gemini_model()
         
         # Get system prompt
         system_prompt = get_personality_prompt(personality)
@@ -643,18 +734,20 @@ async def get_ai_response(user_message: str, personality: str = "genz") -> str:
         # Log the request
         logger.info(f"Calling Gemini with model: {config.GEMINI_MODEL}")
         
-        # Generate response
-        response = model.generate_content(
+        # Generate response without blocking the event loop
+        response = await model.generate_content_async(
             f"{system_prompt}\n\nUser: {user_message}\n\nAssistant:"
         )
         
-        logger.info(f"Gemini response: {response.text}")
+        # response.text re-joins the candidate parts on every access; read it once
+        response_text = response.text
+        logger.info("Gemini response: %s", response_text)
         
         # Clean up the response
-        response_text = response.text.strip()
+        response_text = response_text.strip()
         
         # Remove any system prompts or instructions that might have leaked
-        response_text = re.sub(r"(You are|User:|AI:|Human:|Assistant:).*$", "", response_text, flags=re.MULTILINE)
+        response_text = _AI_LEAK_RE.sub("", response_text)
         response_text = response_text.strip()
         
         # Ensure response is not empty
@@ -753,7 +846,7 @@ async def notify_owner_action(
     if extra_info:
         description_parts.append(extra_info)
     
-    description_parts.append(f"**Timestamp:** {format_unix_timestamp(utcnow())}")
+    description_parts.append(f"**Timestamp:** {discord_timestamp(time.time())}")
     
     embed = make_embed(
         action=action,
@@ -7,13 +7,14 @@ preferences and guild settings, and logs all delivery attempts.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 import discord
 
 import config
-from helpers import make_embed, safe_dm, format_unix_timestamp, utcnow
+from helpers import make_embed, safe_dm
 
 if TYPE_CHECKING:
     from discord.ext import commands
@@ -21,6 +22,137 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Static closing text per action; built once rather than per DM
+_APPEAL_TEXT = {
+    "warn": "If you believe this warning was issued in error, please contact the server administrators.",
+    "mute": "If you believe this mute was issued in error, you may appeal by contacting a server administrator.",
+    "kick": "If you believe this kick was issued in error, please contact the server administrators before rejoining.",
+    "ban": "If you believe this ban was issued in error, please contact the server administrators to appeal.",
+    "flag": "If you believe this flag was issued in error, please contact the server administrators.",
+}
+_FOOTER = f"{config.BOT_NAME} • Timestamp"
+
+
+def _add_appeal(embed: discord.Embed, action_type: str) -> None:
+    """Append the appeal field and notification footer; make_embed already set the timestamp."""
+    embed.add_field(name="📢 Appeal Process", value=_APPEAL_TEXT[action_type], inline=False)
+    embed.set_footer(text=_FOOTER)
+
+
+# Outbound notification DMs in flight at once; discord.py already sleeps and
+# retries on 429s, this just keeps bulk sends from piling onto the DM bucket
+_DM_CONCURRENCY = 10
+
+# DMNotificationSettings field gating each action type
+_ACTION_SETTINGS = {
+    "warn": "notify_warns",
+    "mute": "notify_mutes",
+    "kick": "notify_kicks",
+    "ban": "notify_bans",
+    "flag": "notify_flags",
+}
+
+
+# (title, description, fields) per action; field values are str.format templates
+# filled from the keyword arguments given to send_notification
+_ACTION_SPEC: dict[str, tuple[str, str, tuple[tuple[str, str, bool], ...]]] = {
+    "warn": (
+        "⚠️ Warning Issued in {guild}",
+        "You have been warned by a moderator.",
+        (
+            ("📝 Reason", "{reason}", False),
+            ("👮 Moderator", "{moderator}", True),
+            ("📊 Active Warnings", "{active_warns_count} warning(s)", True),
+            ("⏱️ Expires", "In {warn_duration} days", True),
+            ("📍 Warning ID", "`{warn_id}`", True),
+        ),
+    ),
+    "mute": (
+        "🔇 You Have Been Muted in {guild}",
+        "You have been temporarily muted by a moderator.",
+        (
+            ("⏱️ Duration", "{duration}", True),
+            ("👮 Moderator", "{moderator}", True),
+            ("📝 Reason", "{reason}", False),
+        ),
+    ),
+    "kick": (
+        "👢 You Have Been Kicked from {guild}",
+        "You have been removed from the server by a moderator.",
+        (
+            ("👮 Moderator", "{moderator}", True),
+            ("📝 Reason", "{reason}", False),
+            ("🔗 Rejoining", "You may rejoin the server using an invite link if you wish.", False),
+        ),
+    ),
+    "ban": (
+        "🔨 You Have Been Banned from {guild}",
+        "You have been permanently banned from the server.",
+        (
+            ("👮 Moderator", "{moderator}", True),
+            ("📝 Reason", "{reason}", False),
+        ),
+    ),
+}
+
+
+def _build_embed(action_type: str, guild: discord.Guild, values: dict[str, Any]) -> discord.Embed:
+    title, description, fields = _ACTION_SPEC[action_type]
+    embed = make_embed(action=action_type, title=title.format(guild=guild.name), description=description)
+    for name, template, inline in fields:
+        embed.add_field(name=name, value=template.format_map(values), inline=inline)
+    _add_appeal(embed, action_type)
+    return embed
+
+
+def _build_flag_embed(
+    guild: discord.Guild,
+    *,
+    reason: str,
+    flag_id: int,
+    admin: discord.Member,
+    strike_count: int,
+    max_strikes: int,
+    flag_duration: int,
+) -> discord.Embed:
+    if strike_count >= max_strikes:
+        embed = make_embed(
+            action="flag",
+            title=f"⛔ Staff Termination in {guild.name}",
+            description=f"You have reached {max_strikes} strikes and have been automatically terminated."
+        )
+    else:
+        embed = make_embed(
+            action="flag",
+            title=f"🚩 Staff Flag Issued in {guild.name}",
+            description="You have received a staff flag from an administrator."
+        )
+
+    embed.add_field(name="📝 Reason", value=reason, inline=False)
+    embed.add_field(name="👔 Admin", value=admin.mention, inline=True)
+    embed.add_field(name="📊 Strikes", value=f"{strike_count}/{max_strikes}", inline=True)
+    embed.add_field(name="📍 Flag ID", value=f"`{flag_id}`", inline=True)
+
+    if strike_count < max_strikes:
+        embed.add_field(name="⏱️ Expires", value=f"In {flag_duration} days", inline=True)
+
+        # Add warning if close to termination
+        if strike_count >= max_strikes - 1:
+            embed.add_field(
+                name="⚠️ Warning",
+                value="You are one strike away from automatic termination. Please review your performance.",
+                inline=False
+            )
+    else:
+        embed.add_field(
+            name="⛔ Termination",
+            value="You have been removed from all staff roles and issued a 7-day timeout.",
+            inline=False
+        )
+
+    _add_appeal(embed, "flag")
+    return embed
+
 
 class ModActionNotifier:
     """Handles DM notifications for moderation actions."""
@@ -28,88 +160,98 @@ class ModActionNotifier:
     def __init__(self, bot: commands.Bot, db: Database) -> None:
         self.bot = bot
         self.db = db
+        self._dm_sem = asyncio.Semaphore(_DM_CONCURRENCY)
 
-    async def should_notify(self, guild_id: int, user_id: int, action_type: str) -> bool:
-        """Check if we should send a DM notification."""
-        # Check guild settings
-        settings = await self.db.get_dm_notification_settings(guild_id)
-        if not settings.enabled:
-            return False
+    async def _send_dm(self, user: discord.User | discord.Member, embed: discord.Embed) -> None:
+        async with self._dm_sem:
+            await safe_dm(user, embed=embed)
 
-        # Check action-specific settings
-        action_map = {
-            "warn": settings.notify_warns,
-            "mute": settings.notify_mutes,
-            "kick": settings.notify_kicks,
-            "ban": settings.notify_bans,
-            "flag": settings.notify_flags,
-        }
+    async def _action_enabled(self, guild_id: int, action_type: str) -> bool:
+        """Check the guild's master switch and the per-action toggle."""
+        # Unknown action types are rejected before touching the database
+        field = _ACTION_SETTINGS.get(action_type)
+        if field is None:
+            return False
+        settings = await self.db.get_dm_notification_settings(guild_id)
+        return settings.enabled and getattr(settings, field)
 
-        if action_type not in action_map or not action_map[action_type]:
+    async def should_notify(self, guild_id: int, user_id: int, action_type: str) -> bool:
+        """Check if we should send a DM notification."""
+        if not await self._action_enabled(guild_id, action_type):
             return False
 
         # Check user preferences
         user_wants_dms = await self.db.get_dm_preference(user_id, guild_id)
         return user_wants_dms
 
-    async def send_warn_notification(
+    async def _dispatch(
         self,
-        *,
+        action_type: str,
         user: discord.User | discord.Member,
         guild: discord.Guild,
-        reason: str,
-        warn_id: int,
-        moderator: discord.Member,
-        warn_duration: int,
-        active_warns_count: int
+        build: Callable[[], discord.Embed],
     ) -> bool:
-        """Send a DM notification for a warning."""
-        if not await self.should_notify(guild.id, user.id, "warn"):
+        """Gate, build, send and log one notification."""
+        if not await self.should_notify(guild.id, user.id, action_type):
             return False
 
         try:
-            embed = make_embed(
-                action="warn",
-                title=f"⚠️ Warning Issued in {guild.name}",
-                description=f"You have been warned by a moderator."
-            )
-            embed.add_field(name="📝 Reason", value=reason, inline=False)
-            embed.add_field(name="👮 Moderator", value=moderator.mention, inline=True)
-            embed.add_field(name="📊 Active Warnings", value=f"{active_warns_count} warning(s)", inline=True)
-            embed.add_field(name="⏱️ Expires", value=f"In {warn_duration} days", inline=True)
-            embed.add_field(name="📍 Warning ID", value=f"`{warn_id}`", inline=True)
-            
-            # Add appeal information
-            embed.add_field(
-                name="📢 Appeal Process",
-                value="If you believe this warning was issued in error, please contact the server administrators.",
-                inline=False
-            )
-
-            embed.set_footer(text=f"{config.BOT_NAME} • Timestamp")
-            embed.timestamp = utcnow()
-
-            await safe_dm(user, embed=embed)
+            embed = build()
+            await self._send_dm(user, embed)
             await self.db.log_dm_notification(
                 guild_id=guild.id,
                 user_id=user.id,
-                action_type="warn",
+                action_type=action_type,
                 success=True
             )
-            logger.info(f"Sent warn notification to user {user.id} in guild {guild.id}")
+            logger.info(f"Sent {action_type} notification to user {user.id} in guild {guild.id}")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send warn notification to {user.id}: {e}")
+            logger.error(f"Failed to send {action_type} notification to {user.id}: {e}")
             await self.db.log_dm_notification(
                 guild_id=guild.id,
                 user_id=user.id,
-                action_type="warn",
+                action_type=action_type,
                 success=False,
                 reason=str(e)
             )
             return False
 
+    async def send_notification(
+        self,
+        action_type: str,
+        *,
+        user: discord.User | discord.Member,
+        guild: discord.Guild,
+        **values: Any,
+    ) -> bool:
+        """Send the notification described by ``_ACTION_SPEC[action_type]``."""
+        return await self._dispatch(action_type, user, guild, lambda: _build_embed(action_type, guild, values))
+
+    async def send_warn_notification(
+        self,
+        *,
+        user: discord.User | discord.Member,
+        guild: discord.Guild,
+        reason: str,
+        warn_id: int,
+        moderator: discord.Member,
+        warn_duration: int,
+        active_warns_count: int
+    ) -> bool:
+        """Send a DM notification for a warning."""
+        return await self.send_notification(
+            "warn",
+            user=user,
+            guild=guild,
+            reason=reason,
+            moderator=moderator.mention,
+            active_warns_count=active_warns_count,
+            warn_duration=warn_duration,
+            warn_id=warn_id,
+        )
+
     async def send_mute_notification(
         self,
         *,
@@ -120,49 +262,9 @@ class ModActionNotifier:
         moderator: discord.Member
     ) -> bool:
         """Send a DM notification for a mute."""
-        if not await self.should_notify(guild.id, user.id, "mute"):
-            return False
-
-        try:
-            embed = make_embed(
-                action="mute",
-                title=f"🔇 You Have Been Muted in {guild.name}",
-                description=f"You have been temporarily muted by a moderator."
-            )
-            embed.add_field(name="⏱️ Duration", value=duration, inline=True)
-            embed.add_field(name="👮 Moderator", value=moderator.mention, inline=True)
-            embed.add_field(name="📝 Reason", value=reason, inline=False)
-            
-            # Add appeal information
-            embed.add_field(
-                name="📢 Appeal Process",
-                value="If you believe this mute was issued in error, you may appeal by contacting a server administrator.",
-                inline=False
-            )
-
-            embed.set_footer(text=f"{config.BOT_NAME} • Timestamp")
-            embed.timestamp = utcnow()
-
-            await safe_dm(user, embed=embed)
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="mute",
-                success=True
-            )
-            logger.info(f"Sent mute notification to user {user.id} in guild {guild.id}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send mute notification to {user.id}: {e}")
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="mute",
-                success=False,
-                reason=str(e)
-            )
-            return False
+        return await self.send_notification(
+            "mute", user=user, guild=guild, reason=reason, duration=duration, moderator=moderator.mention
+        )
 
     async def send_kick_notification(
         self,
@@ -173,55 +275,7 @@ class ModActionNotifier:
         moderator: discord.Member
     ) -> bool:
         """Send a DM notification for a kick."""
-        if not await self.should_notify(guild.id, user.id, "kick"):
-            return False
-
-        try:
-            embed = make_embed(
-                action="kick",
-                title=f"👢 You Have Been Kicked from {guild.name}",
-                description=f"You have been removed from the server by a moderator."
-            )
-            embed.add_field(name="👮 Moderator", value=moderator.mention, inline=True)
-            embed.add_field(name="📝 Reason", value=reason, inline=False)
-            
-            # Add rejoin information
-            embed.add_field(
-                name="🔗 Rejoining",
-                value="You may rejoin the server using an invite link if you wish.",
-                inline=False
-            )
-            
-            # Add appeal information
-            embed.add_field(
-                name="📢 Appeal Process",
-                value="If you believe this kick was issued in error, please contact the server administrators before rejoining.",
-                inline=False
-            )
-
-            embed.set_footer(text=f"{config.BOT_NAME} • Timestamp")
-            embed.timestamp = utcnow()
-
-            await safe_dm(user, embed=embed)
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="kick",
-                success=True
-            )
-            logger.info(f"Sent kick notification to user {user.id} in guild {guild.id}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send kick notification to {user.id}: {e}")
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="kick",
-                success=False,
-                reason=str(e)
-            )
-            return False
+        return await self.send_notification("kick", user=user, guild=guild, reason=reason, moderator=moderator.mention)
 
     async def send_ban_notification(
         self,
@@ -232,48 +286,7 @@ class ModActionNotifier:
         moderator: discord.Member
     ) -> bool:
         """Send a DM notification for a ban."""
-        if not await self.should_notify(guild.id, user.id, "ban"):
-            return False
-
-        try:
-            embed = make_embed(
-                action="ban",
-                title=f"🔨 You Have Been Banned from {guild.name}",
-                description=f"You have been permanently banned from the server."
-            )
-            embed.add_field(name="👮 Moderator", value=moderator.mention, inline=True)
-            embed.add_field(name="📝 Reason", value=reason, inline=False)
-            
-            # Add appeal information
-            embed.add_field(
-                name="📢 Appeal Process",
-                value="If you believe this ban was issued in error, please contact the server administrators to appeal.",
-                inline=False
-            )
-
-            embed.set_footer(text=f"{config.BOT_NAME} • Timestamp")
-            embed.timestamp = utcnow()
-
-            await safe_dm(user, embed=embed)
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="ban",
-                success=True
-            )
-            logger.info(f"Sent ban notification to user {user.id} in guild {guild.id}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send ban notification to {user.id}: {e}")
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="ban",
-                success=False,
-                reason=str(e)
-            )
-            return False
+        return await self.send_notification("ban", user=user, guild=guild, reason=reason, moderator=moderator.mention)
 
     async def send_flag_notification(
         self,
@@ -288,72 +301,17 @@ class ModActionNotifier:
         flag_duration: int
     ) -> bool:
         """Send a DM notification for a staff flag."""
-        if not await self.should_notify(guild.id, user.id, "flag"):
-            return False
-
-        try:
-            if strike_count >= max_strikes:
-                embed = make_embed(
-                    action="flag",
-                    title=f"⛔ Staff Termination in {guild.name}",
-                    description=f"You have reached {max_strikes} strikes and have been automatically terminated."
-                )
-            else:
-                embed = make_embed(
-                    action="flag",
-                    title=f"🚩 Staff Flag Issued in {guild.name}",
-                    description=f"You have received a staff flag from an administrator."
-                )
-            
-            embed.add_field(name="📝 Reason", value=reason, inline=False)
-            embed.add_field(name="👔 Admin", value=admin.mention, inline=True)
-            embed.add_field(name="📊 Strikes", value=f"{strike_count}/{max_strikes}", inline=True)
-            embed.add_field(name="📍 Flag ID", value=f"`{flag_id}`", inline=True)
-            
-            if strike_count < max_strikes:
-                embed.add_field(name="⏱️ Expires", value=f"In {flag_duration} days", inline=True)
-                
-                # Add warning if close to termination
-                if strike_count >= max_strikes - 1:
-                    embed.add_field(
-                        name="⚠️ Warning",
-                        value=f"You are one strike away from automatic termination. Please review your performance.",
-                        inline=False
-                    )
-            else:
-                embed.add_field(
-                    name="⛔ Termination",
-                    value="You have been removed from all staff roles and issued a 7-day timeout.",
-                    inline=False
-                )
-            
-            # Add appeal information
-            embed.add_field(
-                name="📢 Appeal Process",
-                value="If you believe this flag was issued in error, please contact the server administrators.",
-                inline=False
-            )
-
-            embed.set_footer(text=f"{config.BOT_NAME} • Timestamp")
-            embed.timestamp = utcnow()
-
-            await safe_dm(user, embed=embed)
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="flag",
-                success=True
-            )
-            logger.info(f"Sent flag notification to user {user.id} in guild {guild.id}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send flag notification to {user.id}: {e}")
-            await self.db.log_dm_notification(
-                guild_id=guild.id,
-                user_id=user.id,
-                action_type="flag",
-                success=False,
-                reason=str(e)
-            )
-            return False
+        return await self._dispatch(
+            "flag",
+            user,
+            guild,
+            lambda: _build_flag_embed(
+                guild,
+                reason=reason,
+                flag_id=flag_id,
+                admin=admin,
+                strike_count=strike_count,
+                max_strikes=max_strikes,
+                flag_duration=flag_duration,
+            ),
+        )
@@ -7,12 +7,13 @@ and quality of moderation actions.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import discord
+import orjson
 
 import config
 from helpers import role_level_for_member, is_staff_member, make_embed, utcnow
@@ -23,6 +24,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# analyze_all_staff hands control back to the event loop after this many members
+_YIELD_EVERY = 64
+
+# guild_id -> (source role-id lists, their union). Engines are created per
+# command, so this lives at module level; it is checked against the identity
+# of the GuildSettings lists, which the database replaces on every reload.
+_staff_role_sets: dict[int, tuple[tuple[list[int], ...], frozenset[int]]] = {}
+
+
+def _staff_role_ids(settings: GuildSettings) -> frozenset[int]:
+    """Union of every staff-tier role ID for a guild, reused until its settings change."""
+    sources = (
+        settings.staff_role_ids,
+        settings.moderator_role_ids,
+        settings.senior_mod_role_ids,
+        settings.head_mod_role_ids,
+    )
+    cached = _staff_role_sets.get(settings.guild_id)
+    if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+        return cached[1]
+    role_ids = frozenset().union(*sources)
+    _staff_role_sets[settings.guild_id] = (sources, role_ids)
+    return role_ids
+
 
 class StaffPromotionEngine:
     """Analyzes staff performance and generates promotion/demotion suggestions."""
@@ -54,21 +79,41 @@ class StaffPromotionEngine:
         self.bot = bot
         self.db = db
 
-    async def analyze_staff_performance(self, guild: discord.Guild, staff_member: discord.Member, settings: GuildSettings) -> dict:
-        """Analyze a staff member's performance and return metrics."""
-        # Get mod stats
-        stats = await self.db.get_mod_stats(guild.id, staff_member.id)
+    async def analyze_staff_performance(
+        self,
+        guild: discord.Guild,
+        staff_member: discord.Member,
+        settings: GuildSettings,
+        *,
+        current_level: str | None = None
+    ) -> dict:
+        """Analyze a staff member's performance and return metrics.
+        
+        Pass ``current_level`` when the caller already resolved the member's role level.
+        """
+        # Get mod stats (window totals are summed in SQL)
+        stats = (await self.db.get_staff_perf_bulk(guild.id, [staff_member.id]))[staff_member.id]
         
         # Get staff flags
         flags = await self.db.get_active_staff_flags(guild_id=guild.id, staff_user_id=staff_member.id)
-        active_flags = len(flags)
-        
+        return self._build_metrics(staff_member, settings, stats, len(flags), current_level=current_level)
+
+    def _build_metrics(
+        self,
+        staff_member: discord.Member,
+        settings: GuildSettings,
+        stats: dict,
+        active_flags: int,
+        *,
+        current_level: str | None = None
+    ) -> dict:
+        """Derive performance metrics from a get_staff_perf_bulk row and flag count."""
         # Calculate tenure (approximate based on joined date)
         tenure_days = (utcnow() - staff_member.joined_at).days if staff_member.joined_at else 0
         
         # Calculate activity score (weighted: recent > older)
-        total_7d = stats["warns_7d"] + stats["mutes_7d"] + stats["kicks_7d"] + stats["bans_7d"]
-        total_30d = stats["warns_30d"] + stats["mutes_30d"] + stats["kicks_30d"] + stats["bans_30d"]
+        total_7d = stats["total_7d"]
+        total_30d = stats["total_30d"]
         
         # Activity score: weight recent activity higher
         activity_score = 0.0
@@ -78,7 +123,8 @@ class StaffPromotionEngine:
             activity_score *= (0.7 + recent_ratio * 0.3)  # Boost for consistent recent activity
         
         # Get current role level
-        current_level = role_level_for_member(staff_member, settings)
+        if current_level is None:
+            current_level = role_level_for_member(staff_member, settings)
         
         return {
             "user_id": staff_member.id,
@@ -98,7 +144,7 @@ class StaffPromotionEngine:
             "activity_score": activity_score,
         }
 
-    async def check_promotion_eligibility(self, metrics: dict, promotion_type: str) -> tuple[bool, float, str]:
+    def check_promotion_eligibility(self, metrics: dict, promotion_type: str) -> tuple[bool, float, str]:
         """Check if staff member is eligible for promotion.
         
         Returns: (eligible, confidence, reason)
@@ -146,7 +192,7 @@ class StaffPromotionEngine:
         
         return True, confidence, "\n".join(reasons)
 
-    async def check_demotion_warning(self, metrics: dict) -> tuple[bool, float, str]:
+    def check_demotion_warning(self, metrics: dict) -> tuple[bool, float, str]:
         """Check if staff member should receive a demotion warning.
         
         Returns: (should_warn, confidence, reason)
@@ -180,24 +226,11 @@ class StaffPromotionEngine:
         
         return False, 0.0, "Performance within acceptable range"
 
-    async def generate_promotion_suggestion(
-        self,
-        *,
-        guild: discord.Guild,
-        staff_member: discord.Member,
-        settings: GuildSettings
-    ) -> int | None:
-        """Generate a promotion suggestion for a staff member.
-        
-        Returns: suggestion_id if created, None otherwise
-        """
-        metrics = await self.analyze_staff_performance(guild, staff_member, settings)
+    def _evaluate_promotion(self, guild: discord.Guild, staff_member: discord.Member, metrics: dict) -> tuple | None:
+        """Return a promotion suggestion row for ``add_promotion_suggestions_bulk``, or None."""
         current_level = metrics["current_level"]
         
         # Determine promotion path
-        promotion_path = None
-        suggested_role = None
-        
         if current_level == "moderator":
             promotion_path = "moderator_to_senior"
             suggested_role = "senior_mod"
@@ -209,25 +242,62 @@ class StaffPromotionEngine:
             return None
         
         # Check eligibility
-        eligible, confidence, reason = await self.check_promotion_eligibility(metrics, promotion_path)
+        eligible, confidence, reason = self.check_promotion_eligibility(metrics, promotion_path)
         
         if not eligible or confidence < 0.5:
             logger.debug(f"Staff member {staff_member.id} not eligible for promotion: {reason}")
             return None
         
-        # Create suggestion
-        metrics_json = json.dumps(metrics)
-        suggestion_id = await self.db.add_promotion_suggestion(
-            guild_id=guild.id,
-            user_id=staff_member.id,
-            suggestion_type="promotion",
-            current_role=current_level,
+        return (
+            guild.id, staff_member.id, "promotion", current_level, suggested_role,
+            confidence, reason, orjson.dumps(metrics).decode(),
+        )
+
+    def _evaluate_demotion(self, guild: discord.Guild, staff_member: discord.Member, metrics: dict) -> tuple | None:
+        """Return a demotion warning row for ``add_promotion_suggestions_bulk``, or None."""
+        # Check if warning is warranted
+        should_warn, confidence, reason = self.check_demotion_warning(metrics)
+        
+        if not should_warn or confidence < 0.5:
+            return None
+        
+        return (
+            guild.id, staff_member.id, "demotion_warning", metrics["current_level"], None,
+            confidence, reason, orjson.dumps(metrics).decode(),
+        )
+
+    async def _store_suggestion(self, row: tuple) -> int:
+        guild_id, user_id, suggestion_type, current_role, suggested_role, confidence, reason, metrics_json = row
+        return await self.db.add_promotion_suggestion(
+            guild_id=guild_id,
+            user_id=user_id,
+            suggestion_type=suggestion_type,
+            current_role=current_role,
             suggested_role=suggested_role,
             confidence=confidence,
             reason=reason,
             metrics=metrics_json
         )
+
+    async def generate_promotion_suggestion(
+        self,
+        *,
+        guild: discord.Guild,
+        staff_member: discord.Member,
+        settings: GuildSettings,
+        metrics: dict | None = None
+    ) -> int | None:
+        """Generate a promotion suggestion for a staff member.
+        
+        Returns: suggestion_id if created, None otherwise
+        """
+        if metrics is None:
+            metrics = await self.analyze_staff_performance(guild, staff_member, settings)
+        row = self._evaluate_promotion(guild, staff_member, metrics)
+        if row is None:
+            return None
         
+        suggestion_id = await self._store_suggestion(row)
         logger.info(f"Generated promotion suggestion {suggestion_id} for {staff_member.id} in {guild.id}")
         return suggestion_id
 
@@ -236,34 +306,20 @@ class StaffPromotionEngine:
         *,
         guild: discord.Guild,
         staff_member: discord.Member,
-        settings: GuildSettings
+        settings: GuildSettings,
+        metrics: dict | None = None
     ) -> int | None:
         """Generate a demotion warning for underperforming staff.
         
         Returns: suggestion_id if created, None otherwise
         """
-        metrics = await self.analyze_staff_performance(guild, staff_member, settings)
-        current_level = metrics["current_level"]
-        
-        # Check if warning is warranted
-        should_warn, confidence, reason = await self.check_demotion_warning(metrics)
-        
-        if not should_warn or confidence < 0.5:
+        if metrics is None:
+            metrics = await self.analyze_staff_performance(guild, staff_member, settings)
+        row = self._evaluate_demotion(guild, staff_member, metrics)
+        if row is None:
             return None
         
-        # Create suggestion
-        metrics_json = json.dumps(metrics)
-        suggestion_id = await self.db.add_promotion_suggestion(
-            guild_id=guild.id,
-            user_id=staff_member.id,
-            suggestion_type="demotion_warning",
-            current_role=current_level,
-            suggested_role=None,
-            confidence=confidence,
-            reason=reason,
-            metrics=metrics_json
-        )
-        
+        suggestion_id = await self._store_suggestion(row)
         logger.info(f"Generated demotion warning {suggestion_id} for {staff_member.id} in {guild.id}")
         return suggestion_id
 
@@ -276,46 +332,49 @@ class StaffPromotionEngine:
         warnings = []
         
         # Get all staff members
-        staff_role_ids = set(
-            settings.staff_role_ids +
-            settings.moderator_role_ids +
-            settings.senior_mod_role_ids +
-            settings.head_mod_role_ids
-        )
-        
-        for member in guild.members:
-            if member.bot:
-                continue
-            
-            # Check if member has any staff role
-            if not any(r.id in staff_role_ids for r in member.roles):
-                continue
-            
-            # Generate promotion suggestion
-            promo_id = await self.generate_promotion_suggestion(
-                guild=guild,
-                staff_member=member,
-                settings=settings
+        staff_role_ids = _staff_role_ids(settings)
+        
+        # One role scan per member, reused for both the analysis loop and total_staff.
+        # Member._roles is the member's sorted array of role IDs, so the set test
+        # walks plain ints without resolving Role objects through the guild cache.
+        role_holders = [m for m in guild.members if not staff_role_ids.isdisjoint(m._roles)]
+        staff_members = [m for m in role_holders if not m.bot]
+        
+        # Fetch stats and flag counts for every staff member up front (2 queries, not 4 per member)
+        staff_ids = [m.id for m in staff_members]
+        all_stats = await self.db.get_staff_perf_bulk(guild.id, staff_ids)
+        flag_counts = await self.db.count_active_staff_flags(guild_id=guild.id, staff_user_ids=staff_ids)
+        # Resolve each member's role level once; both the promotion and demotion paths read it from metrics
+        levels = {m.id: role_level_for_member(m, settings) for m in staff_members}
+        
+        pending_rows = []
+        for i, member in enumerate(staff_members, 1):
+            # The loop body never awaits, so yield periodically on large staff lists
+            if i % _YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+            metrics = self._build_metrics(
+                member, settings, all_stats[member.id], flag_counts[member.id],
+                current_level=levels[member.id]
             )
-            if promo_id:
-                promotions.append(promo_id)
             
-            # Generate demotion warning (only if no promotion suggested)
-            if not promo_id:
-                warn_id = await self.generate_demotion_warning(
-                    guild=guild,
-                    staff_member=member,
-                    settings=settings
-                )
-                if warn_id:
-                    warnings.append(warn_id)
+            # Demotion warning is only considered when no promotion is suggested
+            row = self._evaluate_promotion(guild, member, metrics) or self._evaluate_demotion(guild, member, metrics)
+            if row is not None:
+                pending_rows.append(row)
+        
+        # Store every suggestion in a single transaction
+        for suggestion_id, suggestion_type in await self.db.add_promotion_suggestions_bulk(pending_rows):
+            if suggestion_type == "promotion":
+                promotions.append(suggestion_id)
+            else:
+                warnings.append(suggestion_id)
         
         logger.info(f"Staff analysis complete for guild {guild.id}: {len(promotions)} promotions, {len(warnings)} warnings")
         
         return {
             "promotions": promotions,
             "warnings": warnings,
-            "total_staff": len([m for m in guild.members if any(r.id in staff_role_ids for r in m.roles)]),
+            "total_staff": len(role_holders),
         }
 
     async def create_suggestion_embed(self, suggestion_row) -> discord.Embed:
@@ -355,7 +414,7 @@ class StaffPromotionEngine:
         
         # Parse and display metrics
         try:
-            metrics = json.loads(suggestion_row["metrics"] or "{}")
+            metrics = orjson.loads(suggestion_row["metrics"] or "{}")
             metrics_text = (
                 f"**7-Day Activity:** {metrics.get('total_7d', 0)} actions\n"
                 f"**30-Day Activity:** {metrics.get('total_30d', 0)} actions\n"
@@ -4,13 +4,6 @@ import asyncio
 import os
 from dotenv import load_dotenv
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-    print("google-generativeai not installed. Install with: pip install google-generativeai")
-
 
 async def test_gemini():
     """Test Gemini API connection."""
@@ -21,8 +14,11 @@ async def test_gemini():
         print("❌ GEMINI_API_KEY not set in environment")
         return
     
-    if not GEMINI_AVAILABLE:
-        print("❌ google-generativeai package not available")
+    # Imported here so that merely importing this module stays cheap
+    try:
+        import google.generativeai as genai
+    except ImportError:
+        print("❌ google-generativeai not installed. Install with: pip install google-generativeai")
         return
     
     try:
@@ -34,7 +30,7 @@ async def test_gemini():
         # Test prompt
         prompt = "You are Luna, a strict Discord bot. Respond professionally in under 50 words: What is your purpose?"
         
-        response = await asyncio.to_thread(model.generate_content, prompt)
+        response = await model.generate_content_async(prompt)
         
         print(f"✅ Gemini API Response:\n{response.text}")
         
@@ -0,0 +1,58 @@
+"""Test that buffered mod action flushes keep mod_stats_counts exact."""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from database import Database
+
+
+async def _committer(db: Database, stop: asyncio.Event) -> None:
+    """Commit on the writer connection as often as possible, like unrelated setters do."""
+    while not stop.is_set():
+        await db.conn.commit()
+        await asyncio.sleep(0)
+
+
+async def check_interleaved_commits() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "luna.db"))
+        await db.connect()
+        try:
+            stop = asyncio.Event()
+            committer = asyncio.create_task(_committer(db, stop))
+            try:
+                for _ in range(200):
+                    await db.track_mod_action(guild_id=1, user_id=2, action_type="warns")
+                    await asyncio.sleep(0)
+                await db._flush_mod_actions()
+            finally:
+                stop.set()
+                await committer
+
+            stats = await db.get_mod_stats(1, 2)
+            assert stats["warns_total"] == 200, stats["warns_total"]
+            assert stats["warns_7d"] == 200, stats["warns_7d"]
+
+            # Replaying rows that were already written, as a requeue after a
+            # failed flush does, must not move the counters
+            async with db.conn.execute("SELECT guild_id, user_id, action_type, timestamp FROM mod_stats") as cur:
+                db._mod_buf.extend(tuple(row) for row in await cur.fetchall())
+            await db._flush_mod_actions()
+
+            stats = await db.get_mod_stats(1, 2)
+            assert stats["warns_total"] == 200, stats["warns_total"]
+        finally:
+            await db.close()
+
+
+def test_interleaved_commits() -> None:
+    asyncio.run(check_interleaved_commits())
+
+
+if __name__ == "__main__":
+    asyncio.run(check_interleaved_commits())
+    print("✅ mod stats counters stayed exact")